@@ -0,0 +1,132 @@
+"""Extractor benchmark: the innerText extractors vs their textContent builds.
+
+    uv run python benchmarks/bench_extract.py --articles 200 --calls 50
+
+Loads fixture pages built from the simulator's markup (a timeline of
+``--articles`` tweets and a tweet page with its thread) and times each
+extractor in ``x_cli.js`` against its textContent build (``--source
+dom-text``): median in-page milliseconds per call with layout left clean,
+and with layout invalidated before every call as it is while a timeline
+scrolls, plus the median ``page.evaluate`` round trip.
+Also reports whether both builds returned the same data. The simulator's
+markup has no hidden parts, so they agree there; the "hidden parts"
+fixture is a tweet laid out like X's, with a t.co anchor hiding its
+"https://" prefix and the tail of the URL and a User-Name with a hidden
+label, where they don't. Needs Chromium (``playwright install chromium``)
+but no network or auth.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from playwright.async_api import Page, async_playwright
+
+from simulator import XSimulator
+from x_cli.config import USER_AGENT, VIEWPORT
+from x_cli.js import (
+    EXTRACT_SINGLE_TWEET_LINKS_JS,
+    EXTRACT_THREAD_JS,
+    EXTRACT_TWEETS_JS,
+    TEXT_CONTENT_EXTRACTORS,
+)
+
+# One tweet with the parts X renders but hides: the scheme and the tail of a
+# t.co anchor's display URL, and a label inside the display name's link.
+_HIDDEN_PARTS_HTML = """<!doctype html><html><head><meta charset=utf-8>
+<style>.hidden { display: none; }</style></head><body>
+<article data-testid="tweet">
+<div data-testid="User-Name"><div><a href="/ada"><span>Ada Lovelace</span><span class="hidden">
+Verified account</span></a></div><div><a href="/ada" tabindex="-1"><span>@ada</span></a>
+<span aria-hidden="true">·</span><a href="/ada/status/1870000000000000001">
+<time datetime="2025-01-01T12:00:00.000Z">Jan 1</time></a></div></div>
+<div data-testid="tweetText"><span>Code for the paper: </span><a href="https://t.co/AbCdEf1234"
+rel="noopener noreferrer nofollow" target="_blank" role="link"><span class="hidden">https://</span>github.com/ada/sparse-at<span class="hidden">tention-experiments</span><span
+aria-hidden="true">…</span></a></div>
+</article></body></html>"""
+
+# Times ``calls`` runs of an extractor inside the page; with ``dirty``, a style
+# change before each run leaves layout to be redone by whoever reads it next.
+_TIMED_JS = """([calls, dirty, arg]) => {
+    const extract = EXTRACTOR;
+    const times = [];
+    for (let i = 0; i < calls; i++) {
+        if (dirty) document.body.style.paddingTop = (i % 2) + 'px';
+        const start = performance.now();
+        extract(arg);
+        times.push(performance.now() - start);
+    }
+    return times;
+}"""
+
+
+async def timed(page: Page, js: str, arg, calls: int) -> dict:
+    clean = await page.evaluate(_TIMED_JS.replace("EXTRACTOR", js), [calls, False, arg])
+    dirty = await page.evaluate(_TIMED_JS.replace("EXTRACTOR", js), [calls, True, arg])
+    trips = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await page.evaluate(js, arg)
+        trips.append(time.perf_counter() - start)
+    return {
+        "clean_ms": statistics.median(clean),
+        "dirty_ms": statistics.median(dirty),
+        "evaluate_ms": statistics.median(trips) * 1e3,
+    }
+
+
+async def run(args) -> list[dict]:
+    sim = XSimulator(tweets=args.articles, seed=args.seed)
+    timeline = sim.timeline_page(args.articles)
+    thread_tweet = 3  # a thread tweet in the simulator's dataset
+    fixtures = (
+        ("timeline", timeline, EXTRACT_TWEETS_JS, None),
+        ("single tweet", sim.tweet_html(1), EXTRACT_SINGLE_TWEET_LINKS_JS, None),
+        ("thread", sim.tweet_html(thread_tweet), EXTRACT_THREAD_JS, "@" + sim.handle(thread_tweet)),
+        ("hidden parts", _HIDDEN_PARTS_HTML, EXTRACT_TWEETS_JS, None),
+    )
+    rows = []
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        try:
+            page = await browser.new_page(viewport=VIEWPORT, user_agent=USER_AGENT)
+            for name, html, inner_text_js, arg in fixtures:
+                text_js = TEXT_CONTENT_EXTRACTORS[inner_text_js]
+                await page.set_content(html)
+                same = await page.evaluate(inner_text_js, arg) == await page.evaluate(text_js, arg)
+                for extractor, js in (("innerText", inner_text_js), ("textContent", text_js)):
+                    rows.append({
+                        "fixture": name,
+                        "extractor": extractor,
+                        **await timed(page, js, arg, args.calls),
+                        "same_output": same,
+                    })
+        finally:
+            await browser.close()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=200, help="Tweets on the timeline fixture.")
+    parser.add_argument("--calls", type=int, default=50, help="Timed calls per extractor.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    rows = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'fixture':<14}{'extractor':<13}{'clean ms':>10}{'dirty ms':>10}{'evaluate ms':>13}  same")
+    for r in rows:
+        print(
+            f"{r['fixture']:<14}{r['extractor']:<13}{r['clean_ms']:>10.3f}{r['dirty_ms']:>10.3f}"
+            f"{r['evaluate_ms']:>13.3f}  {'yes' if r['same_output'] else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark: per-link classification cost as the domain rule set grows.
+
+    uv run python benchmarks/bench_links.py
+
+Compares the previous linear scan over a domain dict with the suffix index
+in ``x_cli.links.DomainRules``, and shows the cost of a memoized
+``resolve_link`` hit. Per-link cost of the index should stay flat.
+"""
+
+import argparse
+import random
+import timeit
+from urllib.parse import urlparse
+
+from x_cli.links import DEFAULT_DOMAIN_RULES, DomainRules, resolve_link
+
+
+def linear_classify(url: str, rules: dict[str, str]) -> str | None:
+    """The classifier before the suffix index, for comparison."""
+    domain = urlparse(url).hostname or ""
+    for known, category in rules.items():
+        if domain == known or domain.endswith("." + known):
+            return category
+    if domain.endswith(".github.io"):
+        return "project_page"
+    return None
+
+
+def make_rules(size: int, rng: random.Random) -> dict[str, str]:
+    rules = dict(DEFAULT_DOMAIN_RULES)
+    while len(rules) < size:
+        rules[f"venue{rng.randrange(10**9)}.{rng.choice(['org', 'com', 'net', 'io', 'cc'])}"] = "venue"
+    return rules
+
+
+def make_urls(rules: dict[str, str], n: int, rng: random.Random) -> list[str]:
+    domains = [d.removeprefix("*.") for d in rules]
+    urls = []
+    for i in range(n):
+        if i % 3 == 0:
+            host = f"unknown{rng.randrange(10**6)}.example.com"
+        else:
+            host = rng.choice(["", "www.", "blog."]) + rng.choice(domains)
+        urls.append(f"https://{host}/p/{i}")
+    return urls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--links", type=int, default=2000, help="Links classified per run.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'rules':>7}{'linear ns/link':>16}{'index ns/link':>15}{'memo hit ns/link':>18}")
+    for size in args.sizes:
+        rules = make_rules(size, rng)
+        index = DomainRules(rules)
+        urls = make_urls(rules, args.links, rng)
+        hosts = [urlparse(u).hostname or "" for u in urls]
+
+        def per_link(fn) -> float:
+            return min(timeit.repeat(fn, number=1, repeat=args.repeat)) / len(urls) * 1e9
+
+        linear = per_link(lambda: [linear_classify(u, rules) for u in urls])
+        indexed = per_link(lambda: [index.lookup(urlparse(u).hostname or "") for u in urls])
+        assert [linear_classify(u, rules) for u in urls] == [index.lookup(h) for h in hosts]
+        for u in urls:
+            resolve_link(u, "")
+        memo = per_link(lambda: [resolve_link(u, "") for u in urls])
+        print(f"{size:>7}{linear:>16.0f}{indexed:>15.0f}{memo:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
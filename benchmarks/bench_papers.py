@@ -0,0 +1,90 @@
+"""Micro-benchmark: paper ID extraction, one compiled matcher vs a regex per kind.
+
+    uv run python benchmarks/bench_papers.py --tweets 1000 10000 100000
+
+Builds tweets with text, quote, thread and link fields, a quarter of them
+mentioning a paper, and times ``paper_index`` (every field joined and
+scanned once by ``PAPER_ID_RE``) against scanning each field with one
+regex per ID kind. Per-tweet time should stay flat as tweets grow.
+"""
+
+import argparse
+import re
+import time
+
+from x_cli.links import ARXIV_ID, paper_index
+from x_cli.models import LinkRecord, TweetRecord
+
+PER_KIND = {
+    "doi": re.compile(r"(?<![\w.])(10\.\d{4,9}/[-._;()/:a-zA-Z0-9]+)"),
+    "arxiv": re.compile(rf"(?<![\w.])({ARXIV_ID})(?:v\d+)?\b"),
+    "openreview": re.compile(r"openreview\.net/(?:forum|pdf)\?(?:[^\s#]*&)?id=([\w-]+)"),
+    "acl": re.compile(r"aclanthology\.org/([A-Za-z]\d{2}-\d{4}|\d{4}\.[a-z\d-]+\.\d+)"),
+}
+
+
+def make_tweets(n: int) -> list[TweetRecord]:
+    mentions = (
+        "see arXiv:2401.{:05d}v2",
+        "doi 10.1145/3292500.{}",
+        "https://openreview.net/forum?id=Abc{}",
+        "https://aclanthology.org/2023.acl-long.{}/",
+    )
+    tweets = []
+    for i in range(n):
+        mention = mentions[i % 4].format(i % 1000) if i % 4 == 0 or i % 7 == 0 else ""
+        tweets.append(TweetRecord(
+            text=f"tweet {i} " + "lorem ipsum " * 10 + mention,
+            tweet_url=f"https://x.com/user{i % 50}/status/{10**18 + i}",
+            quoted_text="quoted " * 8,
+            thread_text="thread " * 20,
+            links=[LinkRecord(href=f"https://t.co/{i}", resolved_url=f"https://github.com/org/repo-{i}")],
+        ))
+    return tweets
+
+
+def per_kind_index(tweets: list[TweetRecord]) -> dict[str, list[str]]:
+    """One scan per field per ID kind, for comparison."""
+    index: dict[str, list[str]] = {}
+    for tweet in tweets:
+        fields = [tweet.text, tweet.quoted_text, tweet.thread_text]
+        fields += [lnk.resolved_url or lnk.href for lnk in tweet.links]
+        ids: dict[str, None] = {}
+        for field in fields:
+            for kind, rx in PER_KIND.items():
+                for value in rx.findall(field):
+                    ids[f"{kind}:{value}"] = None
+        for paper_id in ids:
+            index.setdefault(paper_id, []).append(tweet.tweet_url)
+    return index
+
+
+def best(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tweets", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'tweets':>8}{'papers':>8}{'single ms':>11}{'us/tweet':>10}{'per-kind ms':>13}{'us/tweet':>10}")
+    for n in args.tweets:
+        tweets = make_tweets(n)
+        papers = len(paper_index(tweets))
+        single = best(lambda: paper_index(tweets), args.repeat)
+        per_kind = best(lambda: per_kind_index(tweets), args.repeat)
+        print(
+            f"{n:>8}{papers:>8}{single * 1e3:>11.1f}{single / n * 1e6:>10.2f}"
+            f"{per_kind * 1e3:>13.1f}{per_kind / n * 1e6:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Micro-benchmark: pydantic models vs slotted records in the scrape pipeline.
+
+    uv run python benchmarks/bench_records.py --tweets 10000
+
+Builds tweets from extractor-shaped dicts the old way (validated ``Tweet``
+and ``Link`` models) and the new way (``TweetRecord``/``LinkRecord``), and
+reports the full CPU cost per tweet, building included, on each way out
+of the pipeline:
+
+- results: the ``scrape_*`` results behind JSON and pretty output, where
+  records are converted once with ``to_model``;
+- stream: an NDJSON line and a store row per tweet, written straight from
+  records;
+- checkpoint: the snapshots a checkpointed crawl keeps, a ``to_dict`` when
+  a record is collected and another when it is done, against one
+  ``model_dump`` of a model at save time.
+
+``held`` is the memory the in-pipeline objects take.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from x_cli.links import resolve_link
+from x_cli.models import Link, Tweet, TweetRecord
+from x_cli.output import format_ndjson_line
+from x_cli.scraper import _raw_to_tweet
+from x_cli.store import _dump
+
+
+def make_raw(n: int, links: int) -> list[dict]:
+    return [
+        {
+            "text": f"tweet {i} " + "lorem ipsum " * 10,
+            "user_name": f"User {i % 50}",
+            "user_handle": f"@user{i % 50}",
+            "tweet_url": f"https://x.com/user{i % 50}/status/{10**18 + i}",
+            "timestamp": "2025-01-01T00:00:00.000Z",
+            "links": [
+                {"href": f"https://t.co/{i}x{j}", "text": f"github.com/org/repo-{i}-{j}"}
+                for j in range(links)
+            ],
+            "quoted_text": "",
+            "quoted_user": "",
+            "quoted_url": "",
+            "truncated": i % 4 == 0,
+        }
+        for i in range(n)
+    ]
+
+
+def raw_to_model(raw: dict) -> Tweet:
+    """The pre-record conversion: validated models built straight from the dict."""
+    links = []
+    for lnk in raw.get("links", []):
+        resolved_url, domain, category = resolve_link(lnk["href"], lnk.get("text", ""))
+        links.append(Link(
+            href=lnk["href"],
+            text=lnk.get("text", ""),
+            resolved_url=resolved_url,
+            domain=domain,
+            category=category,
+        ))
+    return Tweet(
+        text=raw.get("text", ""),
+        user_name=raw.get("user_name", ""),
+        user_handle=raw.get("user_handle", ""),
+        tweet_url=raw.get("tweet_url", ""),
+        timestamp=raw.get("timestamp"),
+        links=links,
+        quoted_text=raw.get("quoted_text", ""),
+        quoted_user=raw.get("quoted_user", ""),
+        quoted_url=raw.get("quoted_url", ""),
+        truncated=raw.get("truncated", False),
+    )
+
+
+def stream(tweet: Tweet | TweetRecord) -> tuple[str, str]:
+    return format_ndjson_line(tweet), _dump(tweet)
+
+
+def snapshots(record: TweetRecord) -> tuple[dict, dict]:
+    return record.to_dict(), record.to_dict()
+
+
+def best_cpu(fn, repeat: int) -> float:
+    """Fewest CPU seconds over ``repeat`` calls, each with a cold link memo."""
+    times = []
+    for _ in range(repeat):
+        resolve_link.cache_clear()
+        gc.collect()
+        start = time.process_time()
+        fn()
+        times.append(time.process_time() - start)
+    return min(times)
+
+
+def measure(build, raws: list[dict], repeat: int) -> tuple[float, int]:
+    """CPU seconds to build every tweet, and bytes held by the result.
+
+    Memory is measured in a separate run, since tracing slows allocation.
+    """
+    elapsed = best_cpu(lambda: [build(raw) for raw in raws], repeat)
+    resolve_link.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    built = [build(raw) for raw in raws]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return elapsed, held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tweets", type=int, default=10000)
+    parser.add_argument("--links", type=int, default=3, help="Links per tweet.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raws = make_raw(args.tweets, args.links)
+    model_cpu, model_mem = measure(raw_to_model, raws, args.repeat)
+    _, record_mem = measure(_raw_to_tweet, raws, args.repeat)
+
+    def cpu(build) -> float:
+        return best_cpu(lambda: [build(raw) for raw in raws], args.repeat)
+
+    rows = (
+        ("results", "models", model_cpu, model_mem),
+        ("results", "records + to_model", cpu(lambda raw: _raw_to_tweet(raw).to_model()), record_mem),
+        ("stream", "models", cpu(lambda raw: stream(raw_to_model(raw))), model_mem),
+        ("stream", "records", cpu(lambda raw: stream(_raw_to_tweet(raw))), record_mem),
+        ("checkpoint", "models + model_dump", cpu(lambda raw: raw_to_model(raw).model_dump()), model_mem),
+        ("checkpoint", "records + 2 to_dict", cpu(lambda raw: snapshots(_raw_to_tweet(raw))), record_mem),
+    )
+
+    n = args.tweets
+    print(f"{n} tweets, {args.links} links each")
+    print(f"{'':<34}{'cpu ms':>10}{'us/tweet':>10}{'held MiB':>10}{'bytes/tweet':>13}")
+    for path, name, cpu_s, mem in rows:
+        label = f"{path}: {name}"
+        print(f"{label:<34}{cpu_s * 1e3:>10.1f}{cpu_s / n * 1e6:>10.2f}"
+              f"{mem / 2**20:>10.2f}{mem / n:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Offline scraper benchmark against the local X simulator.
+
+    uv run python benchmarks/bench_scrape.py --tweets 200 --count 100 --pacing adaptive
+
+Times the scroll loop (``_iter_timeline``), the planned follow-up visits
+(``_follow_up``) over the collected tweets, and the full ``iter_bookmarks``
+pipeline. For each it
+reports tweets, wall time, tweets/sec, navigations served by the simulator
+and CDP bytes spent on ``page.evaluate`` (script, argument and JSON result).
+Run once with and once without ``--block-resources`` to see the per-request
+cost of ``ResourceBlocker``'s route; the simulator serves every page from a
+route itself, so the lost HTTP cache only shows against the real site.
+Needs Chromium (``playwright install chromium``) but no network or auth.
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import time
+from dataclasses import asdict, dataclass
+
+from playwright.async_api import BrowserContext, Page, async_playwright
+
+from simulator import XSimulator
+from x_cli.browser import ResourceBlocker
+from x_cli.config import BOOKMARKS_URL, DEFAULT_CONCURRENCY, USER_AGENT, VIEWPORT
+from x_cli.models import RunStats, TweetRecord
+from x_cli.pool import PagePool
+from x_cli.scraper import (
+    _follow_up,
+    _iter_timeline,
+    _open_timeline,
+    scrape_bookmarks,
+)
+
+
+@dataclass
+class Phase:
+    name: str
+    tweets: int
+    wall: float
+    navigations: int
+    cdp_bytes: int
+
+    @property
+    def rate(self) -> float:
+        return self.tweets / self.wall if self.wall else 0.0
+
+
+class EvaluateMeter:
+    """Counts bytes sent and received by ``Page.evaluate`` while active."""
+
+    def __init__(self) -> None:
+        self.bytes = 0
+
+    def __enter__(self) -> "EvaluateMeter":
+        self._original = original = Page.evaluate
+
+        async def evaluate(page: Page, expression: str, arg=None):
+            result = await original(page, expression, arg)
+            self.bytes += len(expression) + len(json.dumps(arg)) + len(json.dumps(result, default=str))
+            return result
+
+        Page.evaluate = evaluate
+        return self
+
+    def __exit__(self, *exc) -> None:
+        Page.evaluate = self._original
+
+
+class Measure:
+    """Wall time, simulator navigations and CDP bytes for one phase."""
+
+    def __init__(self, name: str, sim: XSimulator) -> None:
+        self.name = name
+        self.sim = sim
+
+    def __enter__(self) -> "Measure":
+        self._meter = EvaluateMeter().__enter__()
+        self._navigations = self.sim.navigations
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.wall = time.perf_counter() - self._start
+        self._meter.__exit__(*exc)
+
+    def phase(self, tweets: int) -> Phase:
+        return Phase(
+            self.name, tweets, self.wall, self.sim.navigations - self._navigations, self._meter.bytes
+        )
+
+
+async def bench_scroll(context: BrowserContext, sim: XSimulator, args) -> tuple[Phase, list[TweetRecord]]:
+    page = await context.new_page()
+    try:
+        with Measure("scroll", sim) as m:
+            await _open_timeline(page, BOOKMARKS_URL)
+            tweets = [
+                tweet
+                async for batch in _iter_timeline(
+                    page, max_count=args.count, max_scrolls=args.max_scrolls, pacing=args.pacing
+                )
+                for tweet in batch
+            ]
+    finally:
+        await page.close()
+    return m.phase(len(tweets)), tweets
+
+
+async def bench_follow(
+    context: BrowserContext, sim: XSimulator, tweets: list[TweetRecord], args
+) -> tuple[Phase, RunStats]:
+    batch = copy.deepcopy(tweets)
+    stats = RunStats()
+    pool = PagePool(context, args.concurrency)
+    try:
+        with Measure("follow_up", sim) as m:
+            await _follow_up(
+                pool,
+                batch,
+                follow_quotes=True,
+                follow_threads=True,
+                source="dom",
+                cache=None,
+                redirects=None,
+                stats=stats,
+            )
+    finally:
+        await pool.close()
+    return m.phase(len(batch)), stats
+
+
+async def bench_pipeline(context: BrowserContext, sim: XSimulator, args) -> Phase:
+    page = await context.new_page()
+    try:
+        with Measure("pipeline", sim) as m:
+            result = await scrape_bookmarks(
+                page,
+                count=args.count,
+                max_scrolls=args.max_scrolls,
+                pacing=args.pacing,
+                concurrency=args.concurrency,
+            )
+    finally:
+        await page.close()
+    return m.phase(result.total_scraped)
+
+
+async def run(args) -> tuple[list[Phase], RunStats]:
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context(viewport=VIEWPORT, user_agent=USER_AGENT)
+            sim = XSimulator(
+                tweets=args.tweets, batch=args.batch, delay_ms=args.delay_ms, seed=args.seed
+            )
+            await sim.install(context)
+            if args.block_resources:
+                await ResourceBlocker().install(context)  # runs before the simulator's route
+            scroll, tweets = await bench_scroll(context, sim, args)
+            follow, stats = await bench_follow(context, sim, tweets, args)
+            phases = [scroll, follow, await bench_pipeline(context, sim, args)]
+            return phases, stats
+        finally:
+            await browser.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tweets", type=int, default=200, help="Simulated timeline length.")
+    parser.add_argument("--count", type=int, default=100, help="Tweets to collect.")
+    parser.add_argument("--max-scrolls", type=int, default=100)
+    parser.add_argument("--batch", type=int, default=10, help="Tweets loaded per scroll.")
+    parser.add_argument("--delay-ms", type=int, default=300, help="Simulated load time per batch.")
+    parser.add_argument("--pacing", choices=("fixed", "adaptive"), default="fixed")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--block-resources", action="store_true", help="Install ResourceBlocker.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    phases, stats = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps([{**asdict(p), "tweets_per_sec": p.rate} for p in phases], indent=2))
+        return
+    print(f"{'phase':<18}{'tweets':>8}{'wall':>10}{'tweets/s':>10}{'navs':>7}{'cdp bytes':>12}")
+    for p in phases:
+        print(f"{p.name:<18}{p.tweets:>8}{p.wall:>9.2f}s{p.rate:>10.1f}{p.navigations:>7}{p.cdp_bytes:>12}")
+    print(f"follow_up: {stats.page_loads} page loads, {stats.navigations_saved} navigations saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Check the network source against recorded GraphQL payloads.
+
+    uv run python benchmarks/check_network.py            # parsers only
+    uv run python benchmarks/check_network.py --browser  # full pipeline
+
+``fixtures/graphql`` holds Bookmarks, SearchTimeline and TweetDetail
+responses in X's layout, reduced to a few entries each: a plain tweet with
+media, a note tweet, a quote inside a visibility wrapper, a tombstone, an
+unavailable tweet, a search module and a conversation with the author's
+replies. Without flags, ``parse_tweets`` and ``parse_thread`` are checked
+directly. With ``--browser``, pages on ``https://x.com`` fetch the payloads
+and ``page.route`` fulfills them, so ``scrape_bookmarks`` and
+``scrape_search`` run with ``source="network"`` end to end. That needs
+Chromium (``playwright install chromium``) but no network or auth.
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from urllib.parse import urlparse
+
+from playwright.async_api import Route, async_playwright
+
+from x_cli.config import USER_AGENT, VIEWPORT
+from x_cli.network import (
+    BOOKMARKS_OPERATION,
+    SEARCH_OPERATION,
+    TWEET_DETAIL_OPERATION,
+    graphql_operation,
+    parse_thread,
+    parse_tweets,
+)
+from x_cli.scraper import scrape_bookmarks, scrape_search
+
+FIXTURES = Path(__file__).parent / "fixtures" / "graphql"
+PAYLOADS = {
+    BOOKMARKS_OPERATION: "bookmarks.json",
+    SEARCH_OPERATION: "search_timeline.json",
+    TWEET_DETAIL_OPERATION: "tweet_detail.json",
+}
+
+STATUS = "https://x.com/{}/status/{}"
+THREAD_URL = STATUS.format("ada", 1890000000000000100)
+THREAD_LINKS = ["https://arxiv.org/abs/2501.00002", "https://github.com/ada/results"]
+
+
+def load(operation: str) -> dict:
+    return json.loads((FIXTURES / PAYLOADS[operation]).read_text())
+
+
+def check(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+
+
+def check_parsers() -> None:
+    bookmarks = {t.tweet_url: t for t in parse_tweets(load(BOOKMARKS_OPERATION))}
+    check(list(bookmarks) == [
+        STATUS.format("ada", 1870000000000000001),
+        STATUS.format("grace", 1870000000000000002),
+        STATUS.format("barbara", 1870000000000000004),
+        THREAD_URL,
+    ], f"bookmarks: expected tombstone and unavailable tweet dropped: {list(bookmarks)}")
+
+    plain = bookmarks[STATUS.format("ada", 1870000000000000001)]
+    check(plain.text == "New paper on sparse attention https://arxiv.org/abs/2501.00001 "
+          "& code https://github.com/ada/sparse", f"plain: {plain.text!r}")
+    check([lnk.category for lnk in plain.links] == ["arxiv", "github"], "plain: link categories")
+    check(plain.timestamp == "2025-01-01T12:00:00.000Z", f"plain: {plain.timestamp}")
+
+    note = bookmarks[STATUS.format("grace", 1870000000000000002)]
+    check(note.user_name == "Grace Hopper", "note: legacy user layout")
+    check(len(note.text) > 500 and note.text.endswith("https://huggingface.co/grace/model"),
+          "note: full note text not used")
+    check([lnk.resolved_url for lnk in note.links] == ["https://huggingface.co/grace/model"],
+          "note: links should come from the note's entity set")
+
+    quoting = bookmarks[STATUS.format("barbara", 1870000000000000004)]
+    check(quoting.quoted_url == STATUS.format("alan", 1860000000000000003), "quote: unwrapped URL")
+    check(quoting.quoted_user == "@alan", "quote: user")
+    check([lnk.category for lnk in quoting.quoted_links] == ["openreview"], "quote: links")
+
+    search = parse_tweets(load(SEARCH_OPERATION))
+    check(len(search) == 2, f"search: module item missing: {len(search)}")
+    check(search[0].text == "agreed, see https://doi.org/10.1145/362929.362947",
+          f"search: display range: {search[0].text!r}")
+    check(search[1].quoted_url == "", "search: quoted tombstone should leave no quote")
+
+    links, texts, urls = parse_thread([load(TWEET_DETAIL_OPERATION)], "@Ada")
+    check(urls == [THREAD_URL, STATUS.format("ada", 1890000000000000101),
+                   STATUS.format("ada", 1890000000000000102)], f"thread: {urls}")
+    check(len(texts) == 3, "thread: texts")
+    check([lnk.resolved_url for lnk in links] == THREAD_LINKS, f"thread: links {links}")
+
+
+def _page(operation: str) -> str:
+    """A page with one placeholder article that loads ``operation`` like X's client does."""
+    return (
+        '<!doctype html><html><body><article data-testid="tweet"></article><script>'
+        f"fetch('/i/api/graphql/fixture/{operation}?variables=%7B%7D')"
+        "</script></body></html>"
+    )
+
+
+async def _handle(route: Route) -> None:
+    url = route.request.url
+    operation = graphql_operation(url)
+    path = urlparse(url).path
+    if operation in PAYLOADS:
+        await route.fulfill(status=200, content_type="application/json",
+                            body=(FIXTURES / PAYLOADS[operation]).read_text())
+    elif route.request.resource_type != "document":
+        await route.fulfill(status=204, body="")
+    elif path.startswith("/i/bookmarks"):
+        await route.fulfill(status=200, content_type="text/html", body=_page(BOOKMARKS_OPERATION))
+    elif path.startswith("/search"):
+        await route.fulfill(status=200, content_type="text/html", body=_page(SEARCH_OPERATION))
+    elif "/status/" in path:
+        await route.fulfill(status=200, content_type="text/html", body=_page(TWEET_DETAIL_OPERATION))
+    else:
+        await route.fulfill(status=404, content_type="text/html", body="<html></html>")
+
+
+async def check_pipeline() -> None:
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context(viewport=VIEWPORT, user_agent=USER_AGENT)
+            await context.route("https://x.com/**", _handle)
+            page = await context.new_page()
+
+            result = await scrape_bookmarks(page, count=10, max_scrolls=5, source="network")
+            check(result.total_scraped == 4, f"bookmarks: {result.total_scraped} tweets")
+            thread = next(t for t in result.tweets if t.tweet_url == THREAD_URL)
+            check([lnk.resolved_url for lnk in thread.thread_links] == THREAD_LINKS,
+                  f"bookmarks: thread links {thread.thread_links}")
+
+            result = await scrape_search(page, "sparse", count=10, max_scrolls=5, source="network")
+            check(result.total_scraped == 2, f"search: {result.total_scraped} tweets")
+        finally:
+            await browser.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browser", action="store_true",
+                        help="Also run the scrapers against the payloads in Chromium.")
+    args = parser.parse_args()
+
+    check_parsers()
+    print("parsers: ok")
+    if args.browser:
+        asyncio.run(check_pipeline())
+        print("pipeline: ok")
+
+
+if __name__ == "__main__":
+    main()
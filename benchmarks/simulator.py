@@ -0,0 +1,219 @@
+"""Offline X simulator: synthetic timelines and tweet pages served via context.route.
+
+Pages use the markup the extractors in ``x_cli.js`` expect (``article
+[data-testid="tweet"]``, ``User-Name``, ``tweetText``, the "Show more"
+marker, quote cards as ``[role="link"][tabindex="0"]``), so the scraper runs
+unchanged against ``https://x.com/...`` URLs without touching the network.
+
+The dataset is deterministic for a given seed. Every tweet is one of:
+plain with external links, truncated (links only on its own page), quoting
+another tweet, or linkless with an author thread whose replies carry links.
+"""
+
+import html
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Route
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+_LINK_POOL = [
+    ("https://arxiv.org/abs/2401.{:05d}", "arxiv.org/abs/2401.{:05d}"),
+    ("https://github.com/sim-org/repo-{}", "github.com/sim-org/repo-{}"),
+    ("https://t.co/sim{}", "huggingface.co/sim/model-{}"),
+    ("https://sim-lab-{}.github.io/", "sim-lab-{}.github.io"),
+    ("https://example.com/post/{}", "example.com/post/{}"),
+]
+
+_STYLE = "article{display:block;min-height:280px;border-bottom:1px solid #ddd;padding:8px}"
+
+_TIMELINE_SCRIPT = """
+const batches = JSON.parse(document.getElementById('sim-batches').textContent);
+const timeline = document.getElementById('timeline');
+const delay = %(delay)d, keep = %(keep)d;
+let next = 0, loading = false;
+const load = () => {
+    if (next >= batches.length) return;
+    timeline.insertAdjacentHTML('beforeend', batches[next++]);
+    while (keep && timeline.children.length > keep) timeline.firstElementChild.remove();
+};
+load();
+window.addEventListener('scroll', () => {
+    if (loading || window.innerHeight + window.scrollY < document.body.scrollHeight - 600) return;
+    loading = true;
+    setTimeout(() => { load(); loading = false; }, delay);
+});
+"""
+
+
+def _kind(i: int) -> str:
+    if i % 4 == 1:
+        return "truncated"
+    if i % 5 == 2:
+        return "quote"
+    if i % 6 == 3:
+        return "thread"
+    return "plain"
+
+
+class XSimulator:
+    """Serves a synthetic X for one browser context.
+
+    ``tweets`` is the timeline length, delivered ``batch`` at a time as the
+    page scrolls, each batch after ``delay_ms``. Like X, the timeline only
+    keeps the last ``keep`` articles in the DOM (0 keeps them all).
+    ``navigations`` counts document requests served.
+    """
+
+    def __init__(
+        self,
+        *,
+        tweets: int = 200,
+        batch: int = 10,
+        delay_ms: int = 300,
+        keep: int = 30,
+        seed: int = 0,
+    ) -> None:
+        self.tweets = tweets
+        self.batch = batch
+        self.delay_ms = delay_ms
+        self.keep = keep
+        self.seed = seed
+        self.navigations = 0
+
+    async def install(self, context: BrowserContext) -> None:
+        await context.route("https://x.com/**", self._handle)
+
+    # --- dataset -------------------------------------------------------------
+
+    @staticmethod
+    def handle(i: int) -> str:
+        return f"sim_user{i % 37}"
+
+    @staticmethod
+    def status_id(i: int) -> int:
+        return 1_800_000_000_000_000_000 + i
+
+    def status_path(self, i: int) -> str:
+        return f"/{self.handle(i)}/status/{self.status_id(i)}"
+
+    def _links(self, i: int, n: int) -> list[tuple[str, str]]:
+        rng = random.Random(self.seed * 1_000_003 + i)
+        picks = rng.sample(_LINK_POOL, n)
+        return [(href.format(i), text.format(i)) for href, text in picks]
+
+    def _text(self, i: int, words: int) -> str:
+        rng = random.Random(self.seed * 7_919 + i)
+        vocab = ("model", "paper", "results", "scaling", "attention", "data", "new", "open",
+                 "benchmark", "training", "release", "code", "thread", "weights", "eval")
+        return " ".join(rng.choice(vocab) for _ in range(words))
+
+    # --- markup --------------------------------------------------------------
+
+    def _article(self, i: int, *, full: bool = False, handle: str | None = None,
+                 text: str | None = None, links: list[tuple[str, str]] | None = None,
+                 path: str | None = None) -> str:
+        kind = _kind(i)
+        handle = handle or self.handle(i)
+        path = path or self.status_path(i)
+        if text is None:
+            text = self._text(i, 60 if kind == "truncated" and full else 20)
+        if links is None:
+            if kind == "plain":
+                links = self._links(i, 2)
+            elif kind == "truncated":
+                links = self._links(i, 3) if full else []
+            else:
+                links = []
+        anchors = "".join(
+            f' <a href="{html.escape(href)}" rel="noopener">{html.escape(label)}</a>'
+            for href, label in links
+        )
+        parts = [
+            '<article data-testid="tweet">',
+            f'<div data-testid="User-Name"><div>Sim User {i % 37}</div><div>@{handle}</div></div>',
+            f'<a href="{path}"><time datetime="{self._timestamp(i)}">Jan 1</time></a>',
+            f'<div data-testid="tweetText">{html.escape(text)}{anchors}</div>',
+        ]
+        if kind == "truncated" and not full:
+            parts.append('<span data-testid="tweet-text-show-more-link">Show more</span>')
+        if kind == "quote":
+            q = i + self.tweets
+            parts.append(
+                f'<div role="link" tabindex="0" href="{self.status_path(q)}">'
+                f'<div data-testid="tweetText">{html.escape(self._text(q, 12))}</div></div>'
+            )
+        parts.append("</article>")
+        return "".join(parts)
+
+    def _timestamp(self, i: int) -> str:
+        return (BASE_TIME - timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    def _page(self, body: str, script: str = "") -> str:
+        return (
+            "<!doctype html><html><head><meta charset=utf-8>"
+            f"<style>{_STYLE}</style></head><body>{body}"
+            + (f"<script>{script}</script>" if script else "")
+            + "</body></html>"
+        )
+
+    def timeline_html(self) -> str:
+        batches = [
+            "".join(self._article(i) for i in range(start, min(start + self.batch, self.tweets)))
+            for start in range(0, self.tweets, self.batch)
+        ]
+        data = json.dumps(batches).replace("</", "<\\/")
+        script = _TIMELINE_SCRIPT % {"delay": self.delay_ms, "keep": self.keep}
+        return self._page(
+            '<main id="timeline"></main>'
+            f'<script type="application/json" id="sim-batches">{data}</script>',
+            script,
+        )
+
+    def timeline_page(self, n: int) -> str:
+        """A static page with the first ``n`` timeline articles, no scrolling needed."""
+        return self._page("".join(self._article(i) for i in range(n)))
+
+    def tweet_html(self, i: int) -> str:
+        """A tweet's own page: full text and links, plus its thread if it has one."""
+        if i >= self.tweets:
+            # Quoted tweets: a plain tweet by another account.
+            return self._page(self._article(i, full=True, links=self._links(i, 2)))
+        articles = [self._article(i, full=True)]
+        if _kind(i) == "thread":
+            for n in range(1, 4):
+                articles.append(self._article(
+                    i,
+                    text=f"{n}/ " + self._text(i * 10 + n, 15),
+                    links=self._links(i * 10 + n, 1),
+                    path=f"/{self.handle(i)}/status/{self.status_id(i)}{n}",
+                ))
+            articles.append(self._article(
+                i, handle="sim_replier", text="nice", links=[("https://example.com/spam", "spam")],
+                path=f"/sim_replier/status/{self.status_id(i)}9",
+            ))
+        return self._page("".join(articles))
+
+    # --- routing -------------------------------------------------------------
+
+    async def _handle(self, route: Route) -> None:
+        request = route.request
+        if request.resource_type != "document":
+            await route.fulfill(status=204, body="")
+            return
+        self.navigations += 1
+        path = urlparse(request.url).path
+        if path.startswith("/i/bookmarks") or path.startswith("/search"):
+            body = self.timeline_html()
+        elif "/status/" in path:
+            i = int(path.rsplit("/", 1)[-1]) - self.status_id(0)
+            body = self.tweet_html(i) if 0 <= i < 2 * self.tweets else None
+        else:
+            body = None
+        if body is None:
+            await route.fulfill(status=404, content_type="text/html", body="<html></html>")
+        else:
+            await route.fulfill(status=200, content_type="text/html", body=body)
@@ -0,0 +1,79 @@
+"""Auth profiles and browserless checks against their saved storage_state."""
+
+import json
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .config import (
+    AUTH_COOKIE_DOMAINS,
+    AUTH_COOKIES,
+    AUTH_FILE,
+    AUTH_PROFILES_DIR,
+    DEFAULT_PROFILE,
+)
+
+_PROFILE_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]*")
+
+
+def auth_file(profile: str = DEFAULT_PROFILE) -> Path:
+    """Storage-state file of an auth profile; the default one is AUTH_FILE."""
+    if profile == DEFAULT_PROFILE:
+        return AUTH_FILE
+    if not _PROFILE_NAME_RE.fullmatch(profile):
+        raise ValueError(f"Invalid profile name {profile!r}: use letters, digits, '.', '_' and '-'")
+    return AUTH_PROFILES_DIR / f"{profile}.json"
+
+
+def list_profiles() -> list[str]:
+    """Names of the saved auth profiles, the default one first."""
+    names = [DEFAULT_PROFILE] if AUTH_FILE.exists() else []
+    if AUTH_PROFILES_DIR.is_dir():
+        names.extend(sorted(path.stem for path in AUTH_PROFILES_DIR.glob("*.json")))
+    return names
+
+
+def _is_x_domain(domain: str) -> bool:
+    domain = domain.lstrip(".").lower()
+    return any(domain == d or domain.endswith("." + d) for d in AUTH_COOKIE_DOMAINS)
+
+
+def cookie_expiry(state: dict) -> dict[str, float | None]:
+    """Expiry (unix seconds) of each auth cookie present; None for session cookies."""
+    expiry: dict[str, float | None] = {}
+    for cookie in state.get("cookies", []):
+        name = cookie.get("name")
+        if name not in AUTH_COOKIES or not _is_x_domain(cookie.get("domain", "")):
+            continue
+        expires = cookie.get("expires", -1)
+        expiry[name] = None if expires is None or expires < 0 else float(expires)
+    return expiry
+
+
+def check_auth_offline(profile: str = DEFAULT_PROFILE, now: float | None = None) -> tuple[bool, str]:
+    """Whether a profile's auth file holds unexpired auth cookies, with a short reason.
+
+    Only expiry is checked: a session X has revoked still looks valid here.
+    """
+    path = auth_file(profile)
+    if not path.exists():
+        return False, f"no auth file at {path}"
+    try:
+        state = json.loads(path.read_text())
+    except ValueError:
+        return False, f"unreadable auth file {path}"
+
+    now = time.time() if now is None else now
+    expiry = cookie_expiry(state)
+    missing = [name for name in AUTH_COOKIES if name not in expiry]
+    if missing:
+        return False, "missing " + ", ".join(missing)
+    expired = [name for name, expires in expiry.items() if expires is not None and expires <= now]
+    if expired:
+        return False, "expired " + ", ".join(sorted(expired))
+    dated = [expires for expires in expiry.values() if expires is not None]
+    if not dated:
+        return True, "session cookies, no expiry"
+    first = datetime.fromtimestamp(min(dated), timezone.utc)
+    return True, f"expires {first:%Y-%m-%d %H:%M} UTC"
@@ -1,74 +1,197 @@
 """Playwright browser context creation and auth management."""
 
+import asyncio
 import json
 import sys
+from collections import Counter
+from urllib.parse import urlparse
 
-from playwright.sync_api import BrowserContext, Playwright, sync_playwright
+from playwright.async_api import Browser, BrowserContext, Playwright, Route, async_playwright
 
-from .config import AUTH_DIR, AUTH_FILE, USER_AGENT, VIEWPORT
+from .auth import auth_file
+from .config import (
+    ALLOWED_HOSTS,
+    BLOCKED_HOSTS,
+    BLOCKED_RESOURCE_TYPES,
+    DEFAULT_PROFILE,
+    USER_AGENT,
+    VIEWPORT,
+)
+from .daemon import daemon_endpoint
+from .profiling import span
 
 
-def load_auth() -> dict:
-    """Load storage_state from auth file."""
-    if not AUTH_FILE.exists():
-        print(f"Auth file not found: {AUTH_FILE}", file=sys.stderr)
-        print("Run: x auth save", file=sys.stderr)
+def _host_matches(host: str, domains: tuple[str, ...]) -> bool:
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+class ResourceBlocker:
+    """Context route that aborts requests the extractors don't need.
+
+    Requests to ``allowed_hosts`` always go through. Otherwise requests of a
+    blocked resource type or to a blocked (tracker) host are aborted and
+    counted per resource type, or as ``tracker``. Requests let through fall
+    back to routes installed before this one.
+
+    Routing every request disables Chromium's HTTP cache for the context, so
+    X's scripts and styles are fetched again on every page; blocking is
+    opt-in (``--block-resources``). Compare with
+    ``benchmarks/bench_scrape.py --block-resources``.
+    """
+
+    def __init__(
+        self,
+        *,
+        blocked_types: tuple[str, ...] = BLOCKED_RESOURCE_TYPES,
+        blocked_hosts: tuple[str, ...] = BLOCKED_HOSTS,
+        allowed_hosts: tuple[str, ...] = ALLOWED_HOSTS,
+    ) -> None:
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_hosts = blocked_hosts
+        self.allowed_hosts = allowed_hosts
+        self.counts: Counter[str] = Counter()
+
+    def classify(self, resource_type: str, url: str) -> str | None:
+        """Return the reason to block a request, or None to let it through."""
+        host = urlparse(url).hostname or ""
+        if _host_matches(host, self.allowed_hosts):
+            return None
+        if _host_matches(host, self.blocked_hosts):
+            return "tracker"
+        if resource_type in self.blocked_types:
+            return resource_type
+        return None
+
+    async def install(self, context: BrowserContext) -> None:
+        await context.route("**/*", self._handle)
+
+    async def _handle(self, route: Route) -> None:
+        request = route.request
+        reason = self.classify(request.resource_type, request.url)
+        if reason is None:
+            await route.fallback()
+            return
+        self.counts[reason] += 1
+        await route.abort()
+
+
+def load_auth(profile: str = DEFAULT_PROFILE) -> dict:
+    """Load storage_state from a profile's auth file."""
+    path = auth_file(profile)
+    if not path.exists():
+        print(f"Auth file not found: {path}", file=sys.stderr)
+        option = "" if profile == DEFAULT_PROFILE else f" --profile {profile}"
+        print(f"Run: x auth save{option}", file=sys.stderr)
         sys.exit(1)
-    return json.loads(AUTH_FILE.read_text())
+    return json.loads(path.read_text())
 
 
-def create_context(pw: Playwright, *, headless: bool = True) -> BrowserContext:
-    """Create an authenticated browser context."""
-    state = load_auth()
-    browser = pw.chromium.launch(headless=headless)
-    context = browser.new_context(
-        storage_state=state,
-        viewport=VIEWPORT,
-        user_agent=USER_AGENT,
-    )
+async def _launch_browser(pw: Playwright, *, headless: bool = True) -> Browser:
+    """Attach to the warm daemon browser when headless and running, else launch Chromium.
+
+    ``browser.close()`` cleans up either way: on an attached browser it only
+    drops this connection's contexts.
+    """
+    endpoint = daemon_endpoint() if headless else None
+    if endpoint is not None:
+        try:
+            with span("browser:connect"):
+                return await pw.chromium.connect_over_cdp(endpoint)
+        except Exception:
+            pass
+    with span("browser:launch"):
+        return await pw.chromium.launch(headless=headless)
+
+
+async def _new_context(
+    browser: Browser, state: dict, blocker: ResourceBlocker | None
+) -> BrowserContext:
+    with span("browser:new_context"):
+        context = await browser.new_context(
+            storage_state=state,
+            viewport=VIEWPORT,
+            user_agent=USER_AGENT,
+        )
+        if blocker is not None:
+            await blocker.install(context)
+    return context
+
+
+async def create_context(
+    pw: Playwright,
+    *,
+    headless: bool = True,
+    profile: str = DEFAULT_PROFILE,
+    blocker: ResourceBlocker | None = None,
+) -> BrowserContext:
+    """Create an authenticated browser context, optionally with request blocking.
+
+    Close it with ``context.browser.close()``; see ``_launch_browser``.
+    """
+    [context] = await create_contexts(pw, [profile], headless=headless, blocker=blocker)
     return context
 
 
-def save_auth(pw: Playwright) -> None:
-    """Interactive headed login — save storage_state afterward."""
-    browser = pw.chromium.launch(headless=False)
-    context = browser.new_context(
+async def create_contexts(
+    pw: Playwright,
+    profiles: list[str],
+    *,
+    headless: bool = True,
+    blocker: ResourceBlocker | None = None,
+) -> list[BrowserContext]:
+    """One authenticated context per profile, all in one browser.
+
+    Contexts don't share cookies or storage, so each runs as its own
+    account. Close them all with ``contexts[0].browser.close()``.
+    """
+    states = [load_auth(profile) for profile in profiles]  # fail before starting a browser
+    browser = await _launch_browser(pw, headless=headless)
+    return [await _new_context(browser, state, blocker) for state in states]
+
+
+async def save_auth(pw: Playwright, profile: str = DEFAULT_PROFILE) -> None:
+    """Interactive headed login — save storage_state to the profile afterward."""
+    path = auth_file(profile)
+    browser = await pw.chromium.launch(headless=False)
+    context = await browser.new_context(
         viewport=VIEWPORT,
         user_agent=USER_AGENT,
     )
-    page = context.new_page()
-    page.goto("https://x.com/i/bookmarks", wait_until="domcontentloaded")
+    page = await context.new_page()
+    await page.goto("https://x.com/i/bookmarks", wait_until="domcontentloaded")
 
     print("Log in to X in the browser window.")
     print("Press Enter here when done...")
-    input()
+    await asyncio.to_thread(input)
 
-    AUTH_DIR.mkdir(parents=True, exist_ok=True)
-    state = context.storage_state()
-    AUTH_FILE.write_text(json.dumps(state, indent=2))
-    AUTH_FILE.chmod(0o600)
-    print(f"Auth saved to {AUTH_FILE}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state = await context.storage_state()
+    path.write_text(json.dumps(state, indent=2))
+    path.chmod(0o600)
+    print(f"Auth saved to {path}")
 
-    browser.close()
+    await browser.close()
 
 
-def check_auth() -> bool:
-    """Verify auth is still valid by navigating to bookmarks."""
-    if not AUTH_FILE.exists():
+async def check_auth(profile: str = DEFAULT_PROFILE) -> bool:
+    """Verify a profile's auth is still valid by navigating to bookmarks."""
+    if not auth_file(profile).exists():
         return False
 
-    with sync_playwright() as pw:
-        context = create_context(pw, headless=True)
-        page = context.new_page()
+    async with async_playwright() as pw:
+        context = await create_context(pw, headless=True, profile=profile, blocker=ResourceBlocker())
+        page = await context.new_page()
         try:
-            page.goto("https://x.com/i/bookmarks", wait_until="domcontentloaded")
+            with span("goto:timeline"):
+                await page.goto("https://x.com/i/bookmarks", wait_until="domcontentloaded")
             if "login" in page.url.lower():
                 return False
-            page.wait_for_selector(
-                'article[data-testid="tweet"]', timeout=15000
-            )
+            with span("wait_for_selector:timeline"):
+                await page.wait_for_selector(
+                    'article[data-testid="tweet"]', timeout=15000
+                )
             return True
         except Exception:
             return False
         finally:
-            context.browser.close()
+            await context.browser.close()
@@ -0,0 +1,114 @@
+"""On-disk cache of follow-up page extractions, keyed by tweet URL."""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from .config import (
+    FOLLOWUP_CACHE_FILE,
+    FOLLOWUP_CACHE_MAX_AGE,
+    FOLLOWUP_CACHE_MAX_BYTES,
+    FOLLOWUP_CACHE_TTL,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS followups (
+    kind     TEXT NOT NULL,
+    url      TEXT NOT NULL,
+    data     TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    created  REAL NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (kind, url)
+);
+CREATE INDEX IF NOT EXISTS followups_accessed ON followups(accessed);
+"""
+
+
+class FollowupCache:
+    """JSON results of follow-up visits with a TTL and LRU eviction by size.
+
+    ``kind`` separates extractions of the same URL (single tweet vs thread).
+    Entries older than ``ttl`` seconds are misses but stay stored, since
+    other runs may use a longer TTL. Entries older than FOLLOWUP_CACHE_MAX_AGE
+    are deleted on open, and once the stored payloads exceed ``max_bytes``,
+    least recently used entries are dropped. The payload total is counted
+    on open and kept up to date by ``put``.
+    """
+
+    def __init__(
+        self,
+        path: Path = FOLLOWUP_CACHE_FILE,
+        *,
+        ttl: float = FOLLOWUP_CACHE_TTL,
+        max_bytes: int = FOLLOWUP_CACHE_MAX_BYTES,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM followups WHERE created < ?", (time.time() - FOLLOWUP_CACHE_MAX_AGE,)
+            )
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM followups"
+        ).fetchone()[0]
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> "FollowupCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, kind: str, url: str) -> dict | None:
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT data, created FROM followups WHERE kind = ? AND url = ?", (kind, url)
+        ).fetchone()
+        if row is None or now - row[1] > self.ttl:
+            self.misses += 1
+            return None
+        with self._conn:
+            self._conn.execute(
+                "UPDATE followups SET accessed = ? WHERE kind = ? AND url = ?", (now, kind, url)
+            )
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, kind: str, url: str, data: dict) -> None:
+        now = time.time()
+        payload = json.dumps(data, separators=(",", ":"))
+        with self._conn:
+            old = self._conn.execute(
+                "SELECT size FROM followups WHERE kind = ? AND url = ?", (kind, url)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO followups (kind, url, data, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, url, payload, len(payload), now, now),
+            )
+            self._total += len(payload) - (old[0] if old else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under ``max_bytes``."""
+        excess = self._total - self.max_bytes
+        victims = []
+        for kind, url, size in self._conn.execute(
+            "SELECT kind, url, size FROM followups ORDER BY accessed"
+        ):
+            victims.append((kind, url))
+            excess -= size
+            self._total -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM followups WHERE kind = ? AND url = ?", victims)
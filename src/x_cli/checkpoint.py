@@ -0,0 +1,98 @@
+"""Checkpoints for long crawls: collected tweets, follow-up progress, seen IDs."""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from .config import CHECKPOINT_INTERVAL
+from .models import TweetRecord
+
+STATUS_ID_RE = re.compile(r"/status/(\d+)")
+
+
+def status_id(url: str) -> int | None:
+    """Numeric status ID of a tweet URL."""
+    m = STATUS_ID_RE.search(url)
+    return int(m.group(1)) if m else None
+
+
+class Checkpoint:
+    """Crawl progress saved atomically to a JSON file.
+
+    ``key`` names the crawl (bookmarks, or a search query and filter) so a
+    checkpoint is never resumed into a different crawl. Tweets are kept in
+    collection order, as the dicts they are saved as, so that later
+    follow-ups don't change what was recorded; ``seen_ids`` holds the
+    numeric status IDs the timeline has produced and ``done`` those whose
+    follow-ups have finished.
+    """
+
+    def __init__(self, path: Path, key: str) -> None:
+        self.path = path
+        self.key = key
+        self.tweets: dict[int, dict] = {}
+        self.seen_ids: set[int] = set()
+        self.done: set[int] = set()
+        self._saved_at = time.monotonic()
+
+    @classmethod
+    def open(cls, path: Path, key: str, *, resume: bool) -> "Checkpoint":
+        """A fresh checkpoint, or with ``resume`` the one saved at ``path``."""
+        checkpoint = cls(path, key)
+        if not resume or not path.exists():
+            return checkpoint
+        data = json.loads(path.read_text())
+        if data.get("key") != key:
+            raise ValueError(f"Checkpoint {path} is for {data.get('key')!r}, not {key!r}")
+        for raw in data.get("tweets", []):
+            tweet_id = status_id(raw.get("tweet_url", ""))
+            if tweet_id is not None:
+                checkpoint.tweets[tweet_id] = raw
+        checkpoint.seen_ids = set(data.get("seen_ids", [])) | checkpoint.tweets.keys()
+        checkpoint.done = set(data.get("done", [])) & checkpoint.tweets.keys()
+        return checkpoint
+
+    def finished(self) -> list[TweetRecord]:
+        return [TweetRecord.from_dict(t) for i, t in self.tweets.items() if i in self.done]
+
+    def pending(self) -> list[TweetRecord]:
+        """Collected tweets whose follow-ups had not finished."""
+        return [TweetRecord.from_dict(t) for i, t in self.tweets.items() if i not in self.done]
+
+    def seen(self, url: str) -> bool:
+        tweet_id = status_id(url)
+        return tweet_id is not None and tweet_id in self.seen_ids
+
+    def add_collected(self, tweets: list[TweetRecord]) -> None:
+        for tweet in tweets:
+            tweet_id = status_id(tweet.tweet_url)
+            if tweet_id is not None:
+                self.tweets[tweet_id] = tweet.to_dict()
+                self.seen_ids.add(tweet_id)
+        self.maybe_save()
+
+    def mark_done(self, tweet: TweetRecord) -> None:
+        tweet_id = status_id(tweet.tweet_url)
+        if tweet_id is not None:
+            self.tweets[tweet_id] = tweet.to_dict()
+            self.done.add(tweet_id)
+        self.maybe_save()
+
+    def maybe_save(self) -> None:
+        if time.monotonic() - self._saved_at >= CHECKPOINT_INTERVAL:
+            self.save()
+
+    def save(self) -> None:
+        data = {
+            "key": self.key,
+            "seen_ids": sorted(self.seen_ids),
+            "done": sorted(self.done),
+            "tweets": list(self.tweets.values()),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, self.path)
+        self._saved_at = time.monotonic()
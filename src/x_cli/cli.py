@@ -1,14 +1,33 @@
-"""Click CLI: x bookmarks, x search, x auth."""
+"""Click CLI: x bookmarks, x search, x watch, x auth, x daemon.
 
+Only click and config are imported up front so ``x --help`` and
+``x auth check --offline`` start fast; Playwright, rich, pydantic and the
+scraper are imported inside the commands that use them.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import quote as url_quote
 
 import click
-from playwright.sync_api import sync_playwright
 
-from .browser import check_auth, create_context, save_auth
-from .config import DEFAULT_COUNT, DEFAULT_MAX_SCROLLS
-from .output import format_json, format_pretty
-from .scraper import scrape_bookmarks, scrape_search
+from .config import (
+    DEFAULT_ACTION_RATE,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_COUNT,
+    DEFAULT_MAX_SCROLLS,
+    DEFAULT_PROFILE,
+    DEFAULT_SEARCH_PARALLEL,
+    FOLLOWUP_CACHE_TTL,
+    PACING_MODES,
+    SHARD_UNITS,
+    SOURCES,
+    WATCH_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from .checkpoint import Checkpoint
+    from .profiling import Profiler
 
 
 @click.group()
@@ -17,65 +36,377 @@ def cli():
     pass
 
 
+def _open_checkpoint(path: Path | None, key: str, resume: bool) -> "Checkpoint | None":
+    if path is None:
+        if resume:
+            raise click.UsageError("--resume needs --checkpoint PATH.")
+        return None
+    from .checkpoint import Checkpoint
+
+    try:
+        return Checkpoint.open(path, key, resume=resume)
+    except ValueError as exc:
+        raise click.ClickException(str(exc))
+
+
+def _check_profile(profile: str, option: str) -> None:
+    from .auth import auth_file
+
+    try:
+        auth_file(profile)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint=option)
+
+
+def _accounts(accounts: tuple[str, ...]) -> list[str]:
+    """Auth profiles from repeated --account options, the default one if none."""
+    profiles = list(dict.fromkeys(accounts)) or [DEFAULT_PROFILE]
+    for profile in profiles:
+        _check_profile(profile, "--account")
+    return profiles
+
+
+def _start_profiler(profile: bool, trace_path: Path | None) -> "Profiler | None":
+    if not profile and trace_path is None:
+        return None
+    from .profiling import Profiler, set_profiler
+
+    profiler = Profiler()
+    set_profiler(profiler)
+    return profiler
+
+
+def _report_profile(profiler: "Profiler | None", trace_path: Path | None) -> None:
+    if profiler is None:
+        return
+    from .output import format_profile
+
+    click.echo(format_profile(profiler), err=True)
+    if trace_path is not None:
+        profiler.write_trace(trace_path)
+        click.echo(f"Trace written to {trace_path}", err=True)
+
+
 @cli.command()
 @click.option("--count", default=DEFAULT_COUNT, help="Max bookmarks to fetch.")
 @click.option("--max-scrolls", default=DEFAULT_MAX_SCROLLS, help="Max scroll iterations.")
 @click.option("--follow-quotes/--no-follow-quotes", default=True, help="Follow quoted tweets for links.")
 @click.option("--follow-threads/--no-follow-threads", default=True, help="Follow author threads for links.")
+@click.option("--concurrency", default=DEFAULT_CONCURRENCY, type=click.IntRange(min=1), help="Tabs used for follow-up visits.")
+@click.option("--pacing", type=click.Choice(PACING_MODES), default="fixed", help="Scroll pacing: fixed sleeps or wait for new tweets.")
+@click.option("--source", type=click.Choice(SOURCES), default="dom", help="Read tweets from the DOM, from its raw textContent (dom-text: faster, but keeps text X hides in links and names) or from captured GraphQL responses.")
+@click.option("--cache/--no-cache", default=True, help="Reuse cached quote/thread/full-text visits.")
+@click.option("--cache-ttl", default=FOLLOWUP_CACHE_TTL / 3600, type=click.FloatRange(min=0), help="Hours a cached visit stays valid.")
+@click.option("--block-resources/--no-block-resources", default=False, help="Abort image, media, font and tracker requests. Routes every request through x-cli, which turns off the browser's HTTP cache.")
+@click.option("--resolve-tco", is_flag=True, help="Follow t.co redirects with HEAD requests instead of guessing from link text.")
+@click.option("--checkpoint", "checkpoint_path", type=click.Path(dir_okay=False, path_type=Path), help="Save crawl progress to PATH as it runs.")
+@click.option("--resume", is_flag=True, help="Continue the crawl saved in --checkpoint.")
+@click.option("--sync", is_flag=True, help="Only fetch bookmarks not in the local store, then store them.")
+@click.option("--account", "accounts", multiple=True, metavar="PROFILE", help="Auth profile to use (x auth save --profile). Repeat to scrape several accounts in parallel and merge.")
 @click.option("--pretty", is_flag=True, help="Rich table output instead of JSON.")
-def bookmarks(count, max_scrolls, follow_quotes, follow_threads, pretty):
+@click.option("--ndjson", is_flag=True, help="Stream one compact JSON line per tweet as it finishes.")
+@click.option("--profile", is_flag=True, help="Print per-phase timings (count, total, p50, p95) to stderr.")
+@click.option("--profile-trace", type=click.Path(dir_okay=False, path_type=Path), help="Also write the timings as a Chrome trace-event JSON file.")
+def bookmarks(count, max_scrolls, follow_quotes, follow_threads, concurrency, pacing, source, cache, cache_ttl, block_resources, resolve_tco, checkpoint_path, resume, sync, accounts, pretty, ndjson, profile, profile_trace):
     """Scrape your Twitter/X bookmarks."""
-    with sync_playwright() as pw:
-        context = create_context(pw)
-        page = context.new_page()
-        try:
-            result = scrape_bookmarks(
-                page,
-                count=count,
-                max_scrolls=max_scrolls,
-                follow_quotes=follow_quotes,
-                follow_threads=follow_threads,
-            )
-        finally:
-            context.browser.close()
-
-    if pretty:
-        format_pretty(result)
-    else:
-        click.echo(format_json(result))
+    import asyncio
+
+    from playwright.async_api import async_playwright
+
+    from .browser import ResourceBlocker, create_contexts
+    from .cache import FollowupCache
+    from .models import RunStats
+    from .output import format_json, format_ndjson_line, format_pretty, format_rate_limits
+    from .pacing import TokenBucket, set_budget
+    from .profiling import span
+    from .redirects import RedirectResolver
+    from .scraper import iter_bookmarks, iter_bookmarks_sharded, scrape_bookmarks, scrape_bookmarks_sharded
+    from .store import TweetStore
+
+    profiles = _accounts(accounts)
+    if len(profiles) > 1 and checkpoint_path is not None:
+        raise click.UsageError("--checkpoint works with a single --account.")
+    checkpoint = _open_checkpoint(checkpoint_path, "bookmarks", resume)
+
+    async def run():
+        set_budget(TokenBucket())  # unpaced, but carries rate-limit backoffs to every tab
+        async with async_playwright() as pw:
+            blocker = ResourceBlocker() if block_resources else None
+            contexts = await create_contexts(pw, profiles, blocker=blocker)
+            store = TweetStore() if sync else None
+            followup_cache = FollowupCache(ttl=cache_ttl * 3600) if cache else None
+            redirects = RedirectResolver() if resolve_tco else None
+            try:
+                options = dict(
+                    count=count,
+                    max_scrolls=max_scrolls,
+                    follow_quotes=follow_quotes,
+                    follow_threads=follow_threads,
+                    concurrency=concurrency,
+                    pacing=pacing,
+                    source=source,
+                    store=store,
+                    cache=followup_cache,
+                    redirects=redirects,
+                )
+                if len(contexts) > 1:
+                    if ndjson:
+                        async for tweet in iter_bookmarks_sharded(contexts, stats=stats, **options):
+                            click.echo(format_ndjson_line(tweet))
+                        return None
+                    result = await scrape_bookmarks_sharded(contexts, **options)
+                else:
+                    page = await contexts[0].new_page()
+                    if ndjson:
+                        async for tweet in iter_bookmarks(page, checkpoint=checkpoint, stats=stats, **options):
+                            click.echo(format_ndjson_line(tweet))
+                        return None
+                    result = await scrape_bookmarks(page, checkpoint=checkpoint, **options)
+                if blocker is not None:
+                    result.stats.blocked_requests = dict(blocker.counts)
+                return result
+            finally:
+                if store is not None:
+                    store.close()
+                if followup_cache is not None:
+                    followup_cache.close()
+                if redirects is not None:
+                    redirects.close()
+                await contexts[0].browser.close()
+
+    stats = RunStats()  # filled in by --ndjson runs, which have no result to report it in
+    profiler = _start_profiler(profile, profile_trace)
+    try:
+        with span("run"):
+            result = asyncio.run(run())
+        if ndjson:
+            summary = format_rate_limits(stats)
+            if summary:
+                click.echo(summary, err=True)
+            return
+        if pretty:
+            format_pretty(result)
+        else:
+            click.echo(format_json(result))
+    finally:
+        _report_profile(profiler, profile_trace)
 
 
 @cli.command()
-@click.argument("query")
-@click.option("--count", default=DEFAULT_COUNT, help="Max tweets to fetch.")
+@click.argument("query", required=False)
+@click.option("--queries-file", type=click.File("r"), help="Run every query in FILE (one per line) in one browser.")
+@click.option("--count", default=DEFAULT_COUNT, help="Max tweets to fetch (per query or shard).")
 @click.option("--max-scrolls", default=DEFAULT_MAX_SCROLLS, help="Max scroll iterations.")
+@click.option("--since", type=click.DateTime(formats=["%Y-%m-%d"]), help="Only tweets from this day on (YYYY-MM-DD).")
+@click.option("--until", type=click.DateTime(formats=["%Y-%m-%d"]), help="Only tweets before this day (YYYY-MM-DD).")
+@click.option("--shard-by", type=click.Choice(SHARD_UNITS), help="Split --since..--until into one search per day or week, run in parallel and merged by time.")
 @click.option("--filter", "filter_mode", type=click.Choice(["top", "latest"]), default="top", help="Search filter.")
 @click.option("--follow-quotes/--no-follow-quotes", default=True, help="Follow quoted tweets for links.")
 @click.option("--follow-threads/--no-follow-threads", default=True, help="Follow author threads for links.")
+@click.option("--concurrency", default=DEFAULT_CONCURRENCY, type=click.IntRange(min=1), help="Tabs used for follow-up visits.")
+@click.option("--parallel", default=DEFAULT_SEARCH_PARALLEL, type=click.IntRange(min=1), help="Queries scrolling at once with --queries-file or --shard-by.")
+@click.option("--rate", type=click.FloatRange(min=0, min_open=True), help=f"Shared navigations+scrolls per second, per account (default {DEFAULT_ACTION_RATE} with --queries-file or --shard-by).")
+@click.option("--pacing", type=click.Choice(PACING_MODES), default="fixed", help="Scroll pacing: fixed sleeps or wait for new tweets.")
+@click.option("--source", type=click.Choice(SOURCES), default="dom", help="Read tweets from the DOM, from its raw textContent (dom-text: faster, but keeps text X hides in links and names) or from captured GraphQL responses.")
+@click.option("--cache/--no-cache", default=True, help="Reuse cached quote/thread/full-text visits.")
+@click.option("--cache-ttl", default=FOLLOWUP_CACHE_TTL / 3600, type=click.FloatRange(min=0), help="Hours a cached visit stays valid.")
+@click.option("--block-resources/--no-block-resources", default=False, help="Abort image, media, font and tracker requests. Routes every request through x-cli, which turns off the browser's HTTP cache.")
+@click.option("--resolve-tco", is_flag=True, help="Follow t.co redirects with HEAD requests instead of guessing from link text.")
+@click.option("--checkpoint", "checkpoint_path", type=click.Path(dir_okay=False, path_type=Path), help="Save crawl progress to PATH as it runs.")
+@click.option("--resume", is_flag=True, help="Continue the crawl saved in --checkpoint.")
+@click.option("--account", "accounts", multiple=True, metavar="PROFILE", help="Auth profile to use (x auth save --profile). Repeat to split --queries-file across accounts.")
 @click.option("--pretty", is_flag=True, help="Rich table output instead of JSON.")
-def search(query, count, max_scrolls, filter_mode, follow_quotes, follow_threads, pretty):
+@click.option("--ndjson", is_flag=True, help="Stream one compact JSON line per tweet as it finishes.")
+@click.option("--profile", is_flag=True, help="Print per-phase timings (count, total, p50, p95) to stderr.")
+@click.option("--profile-trace", type=click.Path(dir_okay=False, path_type=Path), help="Also write the timings as a Chrome trace-event JSON file.")
+def search(query, queries_file, count, max_scrolls, since, until, shard_by, filter_mode, follow_quotes, follow_threads, concurrency, parallel, rate, pacing, source, cache, cache_ttl, block_resources, resolve_tco, checkpoint_path, resume, accounts, pretty, ndjson, profile, profile_trace):
     """Search Twitter/X for tweets."""
-    encoded_query = url_quote(query)
-    with sync_playwright() as pw:
-        context = create_context(pw)
-        page = context.new_page()
-        try:
-            result = scrape_search(
-                page,
-                encoded_query,
-                count=count,
-                max_scrolls=max_scrolls,
-                filter_mode=filter_mode,
-                follow_quotes=follow_quotes,
-                follow_threads=follow_threads,
-            )
-        finally:
-            context.browser.close()
-
-    if pretty:
-        format_pretty(result)
+    import asyncio
+
+    from playwright.async_api import async_playwright
+
+    from .browser import ResourceBlocker, create_contexts
+    from .cache import FollowupCache
+    from .models import RunStats
+    from .output import format_json, format_ndjson_line, format_pretty, format_rate_limits
+    from .profiling import span
+    from .redirects import RedirectResolver
+    from .pacing import TokenBucket, set_budget
+    from .scraper import (
+        iter_search,
+        iter_search_batch,
+        scrape_search,
+        scrape_search_batch,
+        scrape_search_sharded,
+        time_shards,
+    )
+
+    if (query is None) == (queries_file is None):
+        raise click.UsageError("Give either QUERY or --queries-file.")
+    if queries_file is not None and (since or until):
+        raise click.UsageError("--since and --until work with a single QUERY.")
+    if shard_by is not None and not (since and until):
+        raise click.UsageError("--shard-by needs --since and --until.")
+    if since and until and since >= until:
+        raise click.UsageError("--since must be before --until.")
+    batched = queries_file is not None or shard_by is not None
+    if batched and checkpoint_path is not None:
+        raise click.UsageError("--checkpoint works with a single unsharded QUERY.")
+    profiles = _accounts(accounts)
+    if len(profiles) > 1 and not batched:
+        raise click.UsageError("Several --account need --queries-file or --shard-by to split.")
+    if query is not None and shard_by is None:
+        if since:
+            query += f" since:{since.date().isoformat()}"
+        if until:
+            query += f" until:{until.date().isoformat()}"
+    checkpoint = _open_checkpoint(checkpoint_path, f"search:{filter_mode}:{query}", resume)
+    if queries_file is not None:
+        lines = (line.strip() for line in queries_file)
+        queries = list(dict.fromkeys(url_quote(q) for q in lines if q and not q.startswith("#")))
+    elif shard_by is not None:
+        queries = [url_quote(q) for q in time_shards(query, since.date(), until.date(), shard_by)]
     else:
-        click.echo(format_json(result))
+        queries = [url_quote(query)]
+    if batched and rate is None:
+        rate = DEFAULT_ACTION_RATE
+
+    async def run():
+        if not batched:
+            set_budget(TokenBucket(rate, burst=parallel))
+        async with async_playwright() as pw:
+            blocker = ResourceBlocker() if block_resources else None
+            contexts = await create_contexts(pw, profiles, blocker=blocker)
+            followup_cache = FollowupCache(ttl=cache_ttl * 3600) if cache else None
+            redirects = RedirectResolver() if resolve_tco else None
+            try:
+                options = dict(
+                    count=count,
+                    max_scrolls=max_scrolls,
+                    filter_mode=filter_mode,
+                    follow_quotes=follow_quotes,
+                    follow_threads=follow_threads,
+                    concurrency=concurrency,
+                    pacing=pacing,
+                    source=source,
+                    cache=followup_cache,
+                    redirects=redirects,
+                )
+                if batched:
+                    batch = dict(parallel=parallel, rate=rate, **options)
+                    if ndjson:  # as they arrive, unsorted even when sharded
+                        async for q, tweet in iter_search_batch(contexts, queries, stats=stats, **batch):
+                            click.echo(format_ndjson_line(tweet, query=q))
+                        return None
+                    if shard_by is not None:
+                        result = await scrape_search_sharded(contexts, url_quote(query), queries, **batch)
+                    else:
+                        result = await scrape_search_batch(contexts, queries, **batch)
+                else:
+                    page = await contexts[0].new_page()
+                    if ndjson:
+                        async for tweet in iter_search(page, queries[0], checkpoint=checkpoint, stats=stats, **options):
+                            click.echo(format_ndjson_line(tweet))
+                        return None
+                    result = await scrape_search(page, queries[0], checkpoint=checkpoint, **options)
+                if blocker is not None:
+                    result.stats.blocked_requests = dict(blocker.counts)
+                return result
+            finally:
+                if followup_cache is not None:
+                    followup_cache.close()
+                if redirects is not None:
+                    redirects.close()
+                await contexts[0].browser.close()
+
+    stats = RunStats()  # filled in by --ndjson runs, which have no result to report it in
+    profiler = _start_profiler(profile, profile_trace)
+    try:
+        with span("run"):
+            result = asyncio.run(run())
+        if ndjson:
+            summary = format_rate_limits(stats)
+            if summary:
+                click.echo(summary, err=True)
+            return
+        if pretty:
+            format_pretty(result)
+        else:
+            click.echo(format_json(result))
+    finally:
+        _report_profile(profiler, profile_trace)
+
+
+@cli.command()
+@click.argument("query")
+@click.option("--interval", default=WATCH_INTERVAL, type=click.FloatRange(min=1), help="Seconds between checks for new tweets.")
+@click.option("--follow-quotes/--no-follow-quotes", default=True, help="Follow quoted tweets for links.")
+@click.option("--follow-threads/--no-follow-threads", default=True, help="Follow author threads for links.")
+@click.option("--concurrency", default=DEFAULT_CONCURRENCY, type=click.IntRange(min=1), help="Tabs used for follow-up visits.")
+@click.option("--source", type=click.Choice(SOURCES), default="dom", help="Read tweets from the DOM, from its raw textContent (dom-text: faster, but keeps text X hides in links and names) or from captured GraphQL responses.")
+@click.option("--cache/--no-cache", default=True, help="Reuse cached quote/thread/full-text visits.")
+@click.option("--cache-ttl", default=FOLLOWUP_CACHE_TTL / 3600, type=click.FloatRange(min=0), help="Hours a cached visit stays valid.")
+@click.option("--block-resources/--no-block-resources", default=False, help="Abort image, media, font and tracker requests. Routes every request through x-cli, which turns off the browser's HTTP cache.")
+@click.option("--resolve-tco", is_flag=True, help="Follow t.co redirects with HEAD requests instead of guessing from link text.")
+@click.option("--account", default=DEFAULT_PROFILE, show_default=True, metavar="PROFILE", help="Auth profile to use (x auth save --profile).")
+def watch(query, interval, follow_quotes, follow_threads, concurrency, source, cache, cache_ttl, block_resources, resolve_tco, account):
+    """Watch the latest results for QUERY and stream new tweets as NDJSON.
+
+    Keeps one page open on the live search and checks its top every
+    --interval seconds. Runs until interrupted.
+    """
+    import asyncio
+
+    from playwright.async_api import async_playwright
+
+    from .browser import ResourceBlocker, create_context
+    from .cache import FollowupCache
+    from .models import RunStats
+    from .output import format_ndjson_line, format_rate_limits
+    from .pacing import TokenBucket, set_budget
+    from .redirects import RedirectResolver
+    from .scraper import iter_watch
+
+    _check_profile(account, "--account")
+
+    async def run():
+        set_budget(TokenBucket())  # unpaced, but carries rate-limit backoffs to every tab
+        async with async_playwright() as pw:
+            blocker = ResourceBlocker() if block_resources else None
+            context = await create_context(pw, profile=account, blocker=blocker)
+            followup_cache = FollowupCache(ttl=cache_ttl * 3600) if cache else None
+            redirects = RedirectResolver() if resolve_tco else None
+            try:
+                page = await context.new_page()
+                async for tweet in iter_watch(
+                    page,
+                    url_quote(query),
+                    interval=interval,
+                    follow_quotes=follow_quotes,
+                    follow_threads=follow_threads,
+                    concurrency=concurrency,
+                    source=source,
+                    cache=followup_cache,
+                    redirects=redirects,
+                    stats=stats,
+                ):
+                    click.echo(format_ndjson_line(tweet))
+            finally:
+                if followup_cache is not None:
+                    followup_cache.close()
+                if redirects is not None:
+                    redirects.close()
+                await context.browser.close()
+
+    stats = RunStats()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        summary = format_rate_limits(stats)
+        if summary:
+            click.echo(summary, err=True)
 
 
 @cli.group()
@@ -84,19 +415,111 @@ def auth():
     pass
 
 
+def _save_hint(profile: str) -> str:
+    return "x auth save" if profile == DEFAULT_PROFILE else f"x auth save --profile {profile}"
+
+
 @auth.command("save")
-def auth_save():
+@click.option("--profile", default=DEFAULT_PROFILE, show_default=True, help="Name to save this login under.")
+def auth_save(profile):
     """Interactive headed browser login. Save storage_state."""
-    with sync_playwright() as pw:
-        save_auth(pw)
+    import asyncio
+
+    from playwright.async_api import async_playwright
+
+    from .browser import save_auth
+
+    _check_profile(profile, "--profile")
+
+    async def run():
+        async with async_playwright() as pw:
+            await save_auth(pw, profile)
+
+    asyncio.run(run())
 
 
 @auth.command("check")
-def auth_check():
+@click.option("--profile", default=DEFAULT_PROFILE, show_default=True, help="Auth profile to check.")
+@click.option("--offline", is_flag=True, help="Only check cookie expiry in the saved auth file; no browser.")
+def auth_check(profile, offline):
     """Verify auth is still valid."""
-    valid = check_auth()
+    _check_profile(profile, "--profile")
+    if offline:
+        from .auth import check_auth_offline
+
+        valid, detail = check_auth_offline(profile)
+        if valid:
+            click.echo(f"Auth is valid ({detail}).")
+            return
+        click.echo(f"Auth is expired or missing ({detail}). Run: {_save_hint(profile)}")
+        raise SystemExit(1)
+
+    import asyncio
+
+    from .browser import check_auth
+
+    valid = asyncio.run(check_auth(profile))
     if valid:
         click.echo("Auth is valid.")
     else:
-        click.echo("Auth is expired or missing. Run: x auth save")
+        click.echo(f"Auth is expired or missing. Run: {_save_hint(profile)}")
+        raise SystemExit(1)
+
+
+@auth.command("list")
+def auth_list():
+    """List saved auth profiles with their cookie expiry (no browser)."""
+    from .auth import check_auth_offline, list_profiles
+
+    profiles = list_profiles()
+    if not profiles:
+        click.echo("No auth profiles. Run: x auth save")
+        raise SystemExit(1)
+    for profile in profiles:
+        valid, detail = check_auth_offline(profile)
+        click.echo(f"{profile}\t{'valid' if valid else 'invalid'}\t{detail}")
+
+
+@cli.group()
+def daemon():
+    """Keep a warm headless browser for other commands to attach to.
+
+    The browser's debugging port on 127.0.0.1 has no authentication: every
+    local user and process can control it. Don't use it on shared machines.
+    """
+    pass
+
+
+@daemon.command("start")
+def daemon_start():
+    """Start the browser daemon in the background."""
+    from .daemon import start_daemon
+
+    try:
+        state = start_daemon()
+    except RuntimeError as exc:
+        raise click.ClickException(str(exc))
+    click.echo(f"Daemon running (pid {state['pid']}) at {state['endpoint']}")
+
+
+@daemon.command("stop")
+def daemon_stop():
+    """Stop the browser daemon."""
+    from .daemon import stop_daemon
+
+    if stop_daemon():
+        click.echo("Daemon stopped.")
+    else:
+        click.echo("Daemon is not running.")
+
+
+@daemon.command("status")
+def daemon_status_cmd():
+    """Show whether the browser daemon is running."""
+    from .daemon import daemon_status
+
+    state = daemon_status()
+    if state is None:
+        click.echo("Daemon is not running.")
         raise SystemExit(1)
+    click.echo(f"Daemon running (pid {state['pid']}) at {state['endpoint']}")
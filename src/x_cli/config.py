@@ -2,9 +2,15 @@
 
 from pathlib import Path
 
+CONFIG_DIR = Path.home() / ".config" / "x-cli"
+
 # Auth
-AUTH_DIR = Path.home() / ".config" / "x-cli" / "auth"
-AUTH_FILE = AUTH_DIR / "twitter.json"
+AUTH_DIR = CONFIG_DIR / "auth"
+AUTH_FILE = AUTH_DIR / "twitter.json"  # the default profile
+AUTH_PROFILES_DIR = AUTH_DIR / "profiles"  # named profiles: x auth save --profile NAME
+DEFAULT_PROFILE = "default"
+AUTH_COOKIES = ("auth_token", "ct0")  # session cookies checked by `x auth check --offline`
+AUTH_COOKIE_DOMAINS = ("x.com", "twitter.com")
 
 # Browser
 USER_AGENT = (
@@ -13,6 +19,24 @@ USER_AGENT = (
 )
 VIEWPORT = {"width": 1280, "height": 720}
 
+# Request blocking: the extractors only read text, links and <time> elements
+BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "ads-twitter.com",
+    "ads-api.x.com",
+    "analytics.twitter.com",
+)
+ALLOWED_HOSTS: tuple[str, ...] = ()  # never blocked, whatever the resource type
+
+# Warm browser daemon
+DAEMON_FILE = CONFIG_DIR / "daemon.json"
+DAEMON_LOG = CONFIG_DIR / "daemon.log"
+DAEMON_PORT = 9333  # local CDP port
+DAEMON_START_TIMEOUT = 15.0  # seconds
+
 # URLs
 BOOKMARKS_URL = "https://x.com/i/bookmarks"
 SEARCH_URL = "https://x.com/search"
@@ -22,8 +46,59 @@ NAV_TIMEOUT = 30_000
 SELECTOR_TIMEOUT = 15_000
 SCROLL_PAUSE = 2.0
 INITIAL_LOAD_PAUSE = 1.0
+SCROLL_WAIT_CEILING = 8.0  # adaptive pacing: max wait for new articles
+SCROLL_SETTLE_PAUSE = 0.3  # adaptive pacing: let new articles finish rendering
 
 # Scroll loop defaults
 DEFAULT_COUNT = 50
 DEFAULT_MAX_SCROLLS = 20
 EMPTY_SCROLL_THRESHOLD = 3  # consecutive empty scrolls before stopping
+PACING_MODES = ("fixed", "adaptive")
+# DOM scraping (rendered text, or raw textContent: faster, but with the parts
+# X hides in links and names) or captured GraphQL responses
+SOURCES = ("dom", "dom-text", "network")
+
+# Local tweet store
+STORE_FILE = CONFIG_DIR / "tweets.db"
+SYNC_KNOWN_STREAK = 10  # --sync: consecutive already-stored tweets before stopping
+
+# Link classification
+DOMAIN_RULES_FILE = CONFIG_DIR / "domains.json"  # {"domain": "category"}, merged over the built-ins
+RESOLVE_CACHE_SIZE = 8192  # memoized resolve_link results
+
+# t.co resolution (--resolve-tco)
+SHORTENER_HOSTS = ("t.co",)
+REDIRECT_CACHE_FILE = CONFIG_DIR / "redirects.db"
+DEFAULT_RESOLVE_WORKERS = 8  # concurrent HEAD requests, one keep-alive connection each
+REDIRECT_TIMEOUT = 10.0  # seconds per HEAD request
+REDIRECT_MAX_HOPS = 5
+
+# Follow-up visits
+DEFAULT_CONCURRENCY = 4  # tabs used for truncated/quote/thread visits
+FOLLOWUP_CACHE_FILE = CONFIG_DIR / "followups.db"
+FOLLOWUP_CACHE_TTL = 24 * 3600  # seconds; default --cache-ttl, only applied on reads
+FOLLOWUP_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds; older entries are deleted on open
+FOLLOWUP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+STREAM_BUFFER = 100  # tweets awaiting follow-ups before scrolling pauses
+VISITED_LIMIT = 2_000  # follow-up results kept for reuse by later batches of a run
+THREAD_MAX_SCROLLS = 20  # per tweet page, while new author replies keep appearing
+THREAD_SCROLL_WAIT = 3.0  # seconds to wait for more replies after a thread scroll
+
+# Watch mode (x watch)
+WATCH_INTERVAL = 10.0  # seconds between checks of the live timeline
+WATCH_TOP = 20  # articles read from the top of the timeline per check
+WATCH_SEEN_LIMIT = 10_000  # most recent status URLs remembered as already emitted
+WATCH_STATS_LIMIT = 100  # most recent throttles and skips kept in a watch's stats
+
+# Checkpoints
+CHECKPOINT_INTERVAL = 10.0  # seconds between checkpoint saves during a crawl
+
+# Batch search
+DEFAULT_SEARCH_PARALLEL = 3  # queries scrolling at once
+DEFAULT_ACTION_RATE = 2.0  # shared navigations + scrolls per second across all tabs
+SHARD_UNITS = ("day", "week")  # search --shard-by: one since:/until: sub-query per window
+
+# Rate limiting: HTTP 429s or X's on-page notice pause every tab of the account
+RATE_LIMIT_RETRIES = 3  # backoffs per navigation or timeline before giving up on it
+BACKOFF_BASE = 5.0  # seconds for the first backoff; doubles with each retry
+BACKOFF_MAX = 120.0
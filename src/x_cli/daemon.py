@@ -0,0 +1,174 @@
+"""Warm browser daemon: a headless Chromium that CLI calls attach to over CDP.
+
+The CDP port listens on 127.0.0.1 without authentication: any process on
+this machine, under any user, can connect and drive the browser, including
+the logged-in contexts of a running scrape. Playwright can only attach over
+TCP, so a pipe or Unix socket is not an option. The state file and log are
+kept private to the owner (0600 in a 0700 config directory). Don't run the
+daemon on shared machines.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from .config import CONFIG_DIR, DAEMON_FILE, DAEMON_LOG, DAEMON_PORT, DAEMON_START_TIMEOUT
+
+
+def _read_state() -> dict | None:
+    try:
+        return json.loads(DAEMON_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_state(state: dict) -> None:
+    """Write the state file readable by the owner only."""
+    fd = os.open(DAEMON_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        os.fchmod(fd, 0o600)  # the file may predate this
+        json.dump(state, f)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _cmdline(pid: int) -> str | None:
+    """The process's command line, or None when it can't be read."""
+    try:
+        return Path(f"/proc/{pid}/cmdline").read_bytes().replace(b"\0", b" ").decode()
+    except OSError:
+        pass
+    try:
+        result = subprocess.run(
+            ["ps", "-o", "command=", "-p", str(pid)], capture_output=True, text=True, timeout=2
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _is_daemon(state: dict) -> bool:
+    """Whether the pid in ``state`` is still our daemon, not a reused pid.
+
+    Checks the command line we launched it with; where that can't be read,
+    the CDP endpoint has to answer instead.
+    """
+    if not _pid_alive(state["pid"]):
+        return False
+    cmdline = _cmdline(state["pid"])
+    if cmdline is not None:
+        return "x_cli.daemon" in cmdline
+    return _endpoint_reachable(state["endpoint"])
+
+
+def _endpoint_reachable(endpoint: str) -> bool:
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=0.5) as resp:
+            return resp.status == 200
+    except OSError:
+        return False
+
+
+def daemon_status() -> dict | None:
+    """Return the running daemon's state (pid, endpoint), or None."""
+    state = _read_state()
+    if state is None or not _is_daemon(state):
+        return None
+    if not _endpoint_reachable(state["endpoint"]):
+        return None
+    return state
+
+
+def daemon_endpoint() -> str | None:
+    """CDP endpoint of the running daemon, or None to launch a browser cold."""
+    state = daemon_status()
+    return state["endpoint"] if state else None
+
+
+def start_daemon(port: int = DAEMON_PORT) -> dict:
+    """Spawn the daemon in its own session and wait until it accepts connections."""
+    state = daemon_status()
+    if state is not None:
+        return state
+
+    CONFIG_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    CONFIG_DIR.chmod(0o700)
+    with open(os.open(DAEMON_LOG, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600), "ab") as log:
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "x_cli.daemon", str(port)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        state = daemon_status()
+        if state is not None:
+            return state
+        if proc.poll() is not None:
+            break
+        time.sleep(0.2)
+    raise RuntimeError(f"Daemon did not start; see {DAEMON_LOG}")
+
+
+def stop_daemon() -> bool:
+    """Stop the running daemon. Return False if none was running.
+
+    A state file whose pid is gone or now belongs to another process is
+    deleted without signalling anything.
+    """
+    state = _read_state()
+    if state is None or not _is_daemon(state):
+        DAEMON_FILE.unlink(missing_ok=True)
+        return False
+    os.kill(state["pid"], signal.SIGTERM)
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline and _pid_alive(state["pid"]):
+        time.sleep(0.1)
+    DAEMON_FILE.unlink(missing_ok=True)
+    return True
+
+
+async def _serve(port: int) -> None:
+    """Run Chromium with a local CDP port until SIGTERM/SIGINT."""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(
+            headless=True,
+            args=[f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1"],
+        )
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+
+        _write_state({
+            "pid": os.getpid(),
+            "endpoint": f"http://127.0.0.1:{port}",
+        })
+        try:
+            await stop.wait()
+        finally:
+            DAEMON_FILE.unlink(missing_ok=True)
+            await browser.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(_serve(int(sys.argv[1]) if len(sys.argv) > 1 else DAEMON_PORT))
@@ -1,13 +1,15 @@
 """JavaScript injection strings for tweet extraction."""
 
-EXTRACT_TWEETS_JS = """() => {
+# Shared helpers for the extractors below, reading text through ``textOf``
+# and ``userName``, which one of the two preambles after them defines.
+_TIMELINE_HELPERS_JS = """
     const extractLinks = (container) => {
         const links = [];
         const seen = new Set();
         for (const a of container.querySelectorAll('a[href]')) {
             const href = a.href;
             if (!href || href.startsWith('https://x.com') || href.startsWith('https://twitter.com')) continue;
-            const text = a.innerText.trim().substring(0, 300);
+            const text = textOf(a).trim().substring(0, 300);
             const key = href + '|' + text;
             if (seen.has(key)) continue;
             seen.add(key);
@@ -15,84 +17,207 @@ EXTRACT_TWEETS_JS = """() => {
         }
         return links;
     };
+    const userHandle = (userEl) => (textOf(userEl).match(/@\\w+/) || [''])[0];
+    const articleToTweet = (article, permalink) => {
+        const allTexts = article.querySelectorAll('[data-testid="tweetText"]');
+        const text = allTexts.length > 0 ? textOf(allTexts[0]) : '';
+        const links = extractLinks(article);
+        let quotedText = '', quotedUser = '', quotedUrl = '';
+        for (const inner of article.querySelectorAll('[role="link"][tabindex="0"]')) {
+            const h = inner.getAttribute('href') || '';
+            if (h.includes('/status/')) {
+                quotedUrl = 'https://x.com' + h;
+                const qt = inner.querySelector('[data-testid="tweetText"]');
+                if (qt) quotedText = textOf(qt);
+                break;
+            }
+        }
+        if (!quotedText && allTexts.length > 1) quotedText = textOf(allTexts[1]);
+        const timeEl = article.querySelector('time[datetime]');
+        const userEl = article.querySelector('[data-testid="User-Name"]');
+        // Detect "Show more" truncation — Twitter hides links in collapsed long tweets
+        const showMore = article.querySelector('[data-testid="tweet-text-show-more-link"]');
+        return {
+            text: text.substring(0, 2000),
+            links,
+            quoted_text: quotedText.substring(0, 2000),
+            quoted_user: quotedUser,
+            quoted_url: quotedUrl,
+            timestamp: timeEl ? timeEl.getAttribute('datetime') : null,
+            user_name: userEl ? userName(userEl) : '',
+            user_handle: userEl ? userHandle(userEl) : '',
+            tweet_url: permalink ? permalink.href : '',
+            truncated: !!showMore,
+        };
+    };
+"""
+
+# Rendered text, as the reader sees it: X's t.co anchors hide the "https://"
+# prefix and the tail of long URLs, and User-Name has hidden parts too.
+_INNER_TEXT_JS = """
+    const textOf = (el) => el.innerText;
+    const userName = (userEl) => userEl.innerText.split('\\n')[0];
+"""
+
+# Raw text (source="dom-text"): no style or layout work per read, which adds
+# up on a large, changing timeline, but the hidden parts above are included.
+_TEXT_CONTENT_JS = """
+    const textOf = (el) => el.textContent;
+    const userName = (userEl) => (userEl.firstElementChild || userEl).textContent.trim();
+"""
+
+
+def _extractor(params: str, body: str) -> tuple[str, str]:
+    """The innerText and textContent builds of one extractor."""
+    return tuple(
+        f"({params}) => {{" + text_js + _TIMELINE_HELPERS_JS + body
+        for text_js in (_INNER_TEXT_JS, _TEXT_CONTENT_JS)
+    )
+
+
+EXTRACT_TWEETS_JS, EXTRACT_TWEETS_TEXT_CONTENT_JS = _extractor("", """
+    const tweets = [];
+    for (const article of document.querySelectorAll('article[data-testid="tweet"]')) {
+        try {
+            tweets.push(articleToTweet(article, article.querySelector('a[href*="/status/"]')));
+        } catch (e) {}
+    }
+    return tweets;
+}""")
+
+# Stateful variant of EXTRACT_TWEETS_JS: keeps a window-scoped seen-set keyed by
+# status URL and only extracts (and returns) articles it hasn't returned before.
+# Pass reset=true on the first call for a new scroll loop.
+EXTRACT_NEW_TWEETS_JS, EXTRACT_NEW_TWEETS_TEXT_CONTENT_JS = _extractor("reset", """
+    if (reset || !window.__xcliSeenTweets) window.__xcliSeenTweets = new Set();
+    const seenTweets = window.__xcliSeenTweets;
     const tweets = [];
     for (const article of document.querySelectorAll('article[data-testid="tweet"]')) {
         try {
-            const allTexts = article.querySelectorAll('[data-testid="tweetText"]');
-            const text = allTexts.length > 0 ? allTexts[0].innerText : '';
-            const links = extractLinks(article);
-            let quotedText = '', quotedUser = '', quotedUrl = '';
-            for (const inner of article.querySelectorAll('[role="link"][tabindex="0"]')) {
-                const h = inner.getAttribute('href') || '';
-                if (h.includes('/status/')) {
-                    quotedUrl = 'https://x.com' + h;
-                    const qt = inner.querySelector('[data-testid="tweetText"]');
-                    if (qt) quotedText = qt.innerText;
-                    break;
-                }
-            }
-            if (!quotedText && allTexts.length > 1) quotedText = allTexts[1].innerText;
-            const timeEl = article.querySelector('time');
-            const userEl = article.querySelector('[data-testid="User-Name"]');
             const permalink = article.querySelector('a[href*="/status/"]');
-            // Detect "Show more" truncation — Twitter hides links in collapsed long tweets
-            const showMore = article.querySelector('[data-testid="tweet-text-show-more-link"]');
-            tweets.push({
-                text: text.substring(0, 2000),
-                links,
-                quoted_text: quotedText.substring(0, 2000),
-                quoted_user: quotedUser,
-                quoted_url: quotedUrl,
-                timestamp: timeEl ? timeEl.getAttribute('datetime') : null,
-                user_name: userEl ? userEl.innerText.split('\\n')[0] : '',
-                user_handle: userEl ? (userEl.innerText.match(/@\\w+/) || [''])[0] : '',
-                tweet_url: permalink ? permalink.href : '',
-                truncated: !!showMore,
-            });
+            if (!permalink || seenTweets.has(permalink.href)) continue;
+            tweets.push(articleToTweet(article, permalink));
+            seenTweets.add(permalink.href);
+        } catch (e) {}
+    }
+    return tweets;
+}""")
+
+# The first ``limit`` tweet articles, top of the timeline first (x watch).
+EXTRACT_TOP_TWEETS_JS, EXTRACT_TOP_TWEETS_TEXT_CONTENT_JS = _extractor("limit", """
+    const tweets = [];
+    for (const article of document.querySelectorAll('article[data-testid="tweet"]')) {
+        if (tweets.length >= limit) break;
+        try {
+            tweets.push(articleToTweet(article, article.querySelector('a[href*="/status/"]')));
         } catch (e) {}
     }
     return tweets;
+}""")
+
+# Scrolls a live timeline back to the top and clicks the "Show N posts" pill X
+# shows instead of inserting new tweets; returns whether there was one.
+SHOW_NEW_TWEETS_JS = """() => {
+    window.scrollTo(0, 0);
+    const root = document.querySelector('[data-testid="primaryColumn"]') || document.body;
+    for (const button of root.querySelectorAll('[role="button"], button')) {
+        if (button.closest('article')) continue;
+        if (/^show \\d+ (new )?posts?$/i.test(button.textContent.trim())) {
+            button.click();
+            return true;
+        }
+    }
+    return false;
 }"""
 
-EXTRACT_SINGLE_TWEET_LINKS_JS = """() => {
+EXTRACT_SINGLE_TWEET_LINKS_JS, EXTRACT_SINGLE_TWEET_LINKS_TEXT_CONTENT_JS = _extractor("", """
     const article = document.querySelector('article[data-testid="tweet"]');
     if (!article) return {links: [], text: ''};
-    const links = [];
-    const seen = new Set();
-    for (const a of article.querySelectorAll('a[href]')) {
-        const href = a.href;
-        if (!href || href.startsWith('https://x.com') || href.startsWith('https://twitter.com')) continue;
-        const text = a.innerText.trim().substring(0, 300);
-        const key = href + '|' + text;
-        if (seen.has(key)) continue;
-        seen.add(key);
-        links.push({href, text});
-    }
     const textEl = article.querySelector('[data-testid="tweetText"]');
-    return {links, text: textEl ? textEl.innerText.substring(0, 2000) : ''};
-}"""
+    return {links: extractLinks(article), text: textEl ? textOf(textEl).substring(0, 2000) : ''};
+}""")
 
-EXTRACT_THREAD_JS = """(handle) => {
-    const articles = document.querySelectorAll('article[data-testid="tweet"]');
-    const links = [];
-    const texts = [];
-    const seen = new Set();
-    for (const article of articles) {
+# Author's own tweets on a tweet page, one entry per article with its status
+# URL, so results of successive scrolls can be merged.
+EXTRACT_THREAD_JS, EXTRACT_THREAD_TEXT_CONTENT_JS = _extractor("handle", """
+    const tweets = [];
+    for (const article of document.querySelectorAll('article[data-testid="tweet"]')) {
         const userEl = article.querySelector('[data-testid="User-Name"]');
         if (!userEl) continue;
-        const articleHandle = (userEl.innerText.match(/@\\w+/) || [''])[0].toLowerCase();
-        if (articleHandle !== handle.toLowerCase()) continue;
+        if (userHandle(userEl).toLowerCase() !== handle.toLowerCase()) continue;
+        const permalink = article.querySelector('a[href*="/status/"]');
         const textEl = article.querySelector('[data-testid="tweetText"]');
-        if (textEl) texts.push(textEl.innerText.substring(0, 2000));
-        for (const a of article.querySelectorAll('a[href]')) {
-            const href = a.href;
-            if (!href || href.startsWith('https://x.com') || href.startsWith('https://twitter.com')) continue;
-            const text = a.innerText.trim().substring(0, 300);
-            const key = href + '|' + text;
-            if (seen.has(key)) continue;
-            seen.add(key);
-            links.push({href, text});
+        tweets.push({
+            url: permalink ? permalink.href : '',
+            text: textEl ? textOf(textEl).substring(0, 2000) : '',
+            links: extractLinks(article),
+        });
+    }
+    return tweets;
+}""")
+
+# The textContent build of each extractor, keyed by its default build.
+TEXT_CONTENT_EXTRACTORS = {
+    EXTRACT_TWEETS_JS: EXTRACT_TWEETS_TEXT_CONTENT_JS,
+    EXTRACT_NEW_TWEETS_JS: EXTRACT_NEW_TWEETS_TEXT_CONTENT_JS,
+    EXTRACT_TOP_TWEETS_JS: EXTRACT_TOP_TWEETS_TEXT_CONTENT_JS,
+    EXTRACT_SINGLE_TWEET_LINKS_JS: EXTRACT_SINGLE_TWEET_LINKS_TEXT_CONTENT_JS,
+    EXTRACT_THREAD_JS: EXTRACT_THREAD_TEXT_CONTENT_JS,
+}
+
+# Scrolls one screen down unless already at the bottom; returns whether it was.
+THREAD_SCROLL_JS = """() => {
+    const el = document.scrollingElement || document.documentElement;
+    if (window.scrollY + window.innerHeight >= el.scrollHeight - 2) return true;
+    window.scrollBy(0, window.innerHeight);
+    return false;
+}"""
+
+# Installs (once per document) a MutationObserver that counts tweet articles
+# added to the timeline, and returns the running count.
+ARTICLES_ADDED_JS = """() => {
+    if (window.__xcliArticlesAdded === undefined) {
+        window.__xcliArticlesAdded = 0;
+        const sel = 'article[data-testid="tweet"]';
+        new MutationObserver((mutations) => {
+            for (const m of mutations) {
+                for (const node of m.addedNodes) {
+                    if (node.nodeType !== 1) continue;
+                    if (node.matches(sel)) window.__xcliArticlesAdded++;
+                    else window.__xcliArticlesAdded += node.querySelectorAll(sel).length;
+                }
+            }
+        }).observe(document.body, {childList: true, subtree: true});
+    }
+    return window.__xcliArticlesAdded;
+}"""
+
+WAIT_ARTICLES_ADDED_JS = "(n) => window.__xcliArticlesAdded > n"
+
+# True when X shows its rate-limit or "Something went wrong" notice. Text
+# inside tweet articles is ignored so a tweet *about* rate limits doesn't match.
+RATE_LIMITED_JS = """() => {
+    const root = document.querySelector('[data-testid="primaryColumn"]') || document.body;
+    if (!root) return false;
+    const notice = /rate limit|try again later|something went wrong\\. try reloading/i;
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        if (notice.test(node.nodeValue) && !node.parentElement.closest('article')) return true;
+    }
+    return false;
+}"""
+
+# Clicks the "Retry" button X puts under a timeline whose next page failed to
+# load; returns whether there was one.
+RETRY_TIMELINE_JS = """() => {
+    const root = document.querySelector('[data-testid="primaryColumn"]') || document.body;
+    for (const button of root.querySelectorAll('[role="button"], button')) {
+        if (button.closest('article')) continue;
+        if (button.textContent.trim().toLowerCase() === 'retry') {
+            button.click();
+            return true;
         }
     }
-    return {links, texts};
+    return false;
 }"""
+
@@ -1,9 +1,37 @@
 """t.co URL recovery and link classification."""
 
+import json
 import re
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-ARXIV_ID_RE = re.compile(r"\b(\d{4}\.\d{4,5}(?:v\d+)?)\b")
+from .config import DOMAIN_RULES_FILE, RESOLVE_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models import Tweet, TweetRecord
+
+ARXIV_ID = r"\d{4}\.\d{4,5}"
+
+# Paper identifiers, one named group per kind, matched in a single scan. The
+# leading lookahead lists every kind's first character, which lets the regex
+# engine skip ahead to candidate positions instead of trying each branch at
+# every character. DOIs come first so an arXiv-looking tail stays in the DOI.
+PAPER_ID_RE = re.compile(
+    r"(?=[0-9oa])(?:"
+    r"(?<![\w.])(?P<doi>10\.\d{4,9}/[-._;()/:a-zA-Z0-9]+)"
+    rf"|(?<![\w.])(?P<arxiv>{ARXIV_ID})(?:v\d+)?\b"
+    r"|openreview\.net/(?:forum|pdf)\?(?:[^\s#]*&)?id=(?P<openreview>[\w-]+)"
+    r"|aclanthology\.org/(?P<acl>[A-Za-z]\d{2}-\d{4}|\d{4}\.[a-z\d-]+\.\d+)"
+    r")"
+)
+_ARXIV_DOI_RE = re.compile(rf"10\.48550/arxiv\.({ARXIV_ID})")
 
 PAPER_DOMAINS: dict[str, str] = {
     "arxiv.org": "arxiv",
@@ -19,6 +47,85 @@ PAPER_DOMAINS: dict[str, str] = {
     "github.com": "github",
 }
 
+DEFAULT_DOMAIN_RULES: dict[str, str] = {
+    **PAPER_DOMAINS,
+    "*.github.io": "project_page",
+}
+
+
+@dataclass(slots=True)
+class _Node:
+    """One label of the suffix index."""
+
+    children: dict[str, "_Node"] = field(default_factory=dict)
+    any: str | None = None  # category for the domain and its subdomains
+    sub: str | None = None  # category for subdomains only
+
+
+class DomainRules:
+    """Domain → category rules in a reverse-label suffix index.
+
+    ``example.com`` matches that host and its subdomains, ``*.example.com``
+    only its subdomains. Lookups walk the host's labels from the TLD down,
+    so their cost depends on the host, not on the number of rules; the
+    longest matching suffix wins. Empty labels (``a..b``) are ignored.
+    """
+
+    def __init__(self, rules: Mapping[str, str] = DEFAULT_DOMAIN_RULES) -> None:
+        self._root = _Node()
+        self.size = 0
+        for pattern, category in rules.items():
+            self.add(pattern, category)
+
+    def add(self, pattern: str, category: str) -> None:
+        subdomains_only = pattern.startswith("*.")
+        labels = [label for label in pattern.removeprefix("*.").lower().split(".") if label]
+        if not labels:
+            return
+        node = self._root
+        for label in reversed(labels):
+            node = node.children.setdefault(label, _Node())
+        if subdomains_only:
+            node.sub = category
+        else:
+            node.any = category
+        self.size += 1
+
+    def lookup(self, host: str) -> str | None:
+        labels = [label for label in host.lower().split(".") if label]
+        node = self._root
+        category = None
+        for remaining in range(len(labels) - 1, -1, -1):
+            node = node.children.get(labels[remaining])
+            if node is None:
+                break
+            if node.any is not None:
+                category = node.any
+            elif remaining and node.sub is not None:
+                category = node.sub
+        return category
+
+
+def load_domain_rules(path: Path = DOMAIN_RULES_FILE) -> DomainRules:
+    """Built-in rules plus those from ``path``, a JSON object of domain → category."""
+    rules = dict(DEFAULT_DOMAIN_RULES)
+    if path.exists():
+        try:
+            user_rules = json.loads(path.read_text())
+            if not isinstance(user_rules, dict):
+                raise ValueError("expected an object of domain → category")
+        except ValueError as exc:
+            print(f"Ignoring {path}: {exc}", file=sys.stderr)
+        else:
+            rules.update({domain: str(category) for domain, category in user_rules.items()})
+    return DomainRules(rules)
+
+
+@cache
+def domain_rules() -> DomainRules:
+    """The rule set used by ``classify_domain``, loaded on first use."""
+    return load_domain_rules()
+
 
 def recover_url_from_anchor_text(text: str) -> str | None:
     """Reconstruct a URL from Twitter's split anchor text."""
@@ -56,18 +163,10 @@ def classify_domain(url: str) -> tuple[str, str | None]:
     except Exception:
         return ("", None)
 
-    # Check known domains
-    for known, category in PAPER_DOMAINS.items():
-        if domain == known or domain.endswith("." + known):
-            return (domain, category)
-
-    # *.github.io → project page
-    if domain.endswith(".github.io"):
-        return (domain, "project_page")
-
-    return (domain, None)
+    return (domain, domain_rules().lookup(domain) if domain else None)
 
 
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
 def resolve_link(href: str, anchor_text: str) -> tuple[str, str, str | None]:
     """Resolve a link, returning (resolved_url, domain, category)."""
     # If it's a t.co link, try to recover from anchor text
@@ -82,5 +181,44 @@ def resolve_link(href: str, anchor_text: str) -> tuple[str, str, str | None]:
 
 
 def extract_arxiv_ids(text: str) -> list[str]:
-    """Extract arXiv paper IDs from text."""
-    return ARXIV_ID_RE.findall(text)
+    """Extract arXiv paper IDs from text, without version suffixes."""
+    return [paper_id[6:] for paper_id in extract_paper_ids(text) if paper_id.startswith("arxiv:")]
+
+
+def extract_paper_ids(text: str) -> list[str]:
+    """Extract paper IDs from text as ``kind:id``: arxiv, doi, openreview or acl.
+
+    arXiv version suffixes are dropped and DOIs lowercased, so one paper
+    has one ID; arXiv's own DOIs become arXiv IDs.
+    """
+    ids = []
+    for match in PAPER_ID_RE.finditer(text):
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "doi":
+            value = value.rstrip(".,;:)").lower()
+            arxiv = _ARXIV_DOI_RE.fullmatch(value)
+            if arxiv:
+                kind, value = "arxiv", arxiv.group(1)
+        ids.append(f"{kind}:{value}")
+    return ids
+
+
+def tweet_paper_ids(tweet: "Tweet | TweetRecord") -> list[str]:
+    """Paper IDs in a tweet's text, quote, thread and link URLs, deduplicated.
+
+    All fields are joined and scanned once.
+    """
+    fields = [tweet.text, tweet.quoted_text, tweet.thread_text]
+    for lnk in (*tweet.links, *tweet.quoted_links, *tweet.thread_links):
+        fields.append(lnk.resolved_url or lnk.href)
+    return list(dict.fromkeys(extract_paper_ids("\n".join(fields))))
+
+
+def paper_index(tweets: "Iterable[Tweet | TweetRecord]") -> dict[str, list[str]]:
+    """Paper ID → URLs of the tweets that mention it, in first-seen order."""
+    index: dict[str, list[str]] = {}
+    for tweet in tweets:
+        for paper_id in tweet_paper_ids(tweet):
+            index.setdefault(paper_id, []).append(tweet.tweet_url)
+    return index
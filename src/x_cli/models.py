@@ -1,6 +1,18 @@
-"""Data models."""
+"""Data models.
 
-from pydantic import BaseModel
+``Link`` and ``Tweet`` are the public, validated models. The scrape
+pipeline works on ``LinkRecord``/``TweetRecord`` instead: slotted
+dataclasses with the same fields and no validation, filled only by our own
+extractors and parsers. The ``iter_*`` scrapers yield records: NDJSON
+output reads them as they are, and the store and checkpoints write them
+with ``to_dict``. Only the ``scrape_*`` results convert them, once, with
+``to_model`` (plain construction: pydantic-core validation is cheaper than
+``model_construct`` for these flat models).
+"""
+
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel, Field
 
 
 class Link(BaseModel):
@@ -27,10 +39,135 @@ class Tweet(BaseModel):
     truncated: bool = False
 
 
+@dataclass(slots=True)
+class LinkRecord:
+    href: str
+    text: str = ""
+    resolved_url: str | None = None
+    domain: str | None = None
+    category: str | None = None
+
+    def to_dict(self) -> dict:
+        """The same dict as ``self.to_model().model_dump()``, without building the model."""
+        return {
+            "href": self.href,
+            "text": self.text,
+            "resolved_url": self.resolved_url,
+            "domain": self.domain,
+            "category": self.category,
+        }
+
+    def to_model(self) -> Link:
+        return Link(
+            href=self.href,
+            text=self.text,
+            resolved_url=self.resolved_url,
+            domain=self.domain,
+            category=self.category,
+        )
+
+
+@dataclass(slots=True)
+class TweetRecord:
+    text: str = ""
+    user_name: str = ""
+    user_handle: str = ""
+    tweet_url: str = ""
+    timestamp: str | None = None
+    links: list[LinkRecord] = field(default_factory=list)
+    quoted_text: str = ""
+    quoted_user: str = ""
+    quoted_url: str = ""
+    quoted_links: list[LinkRecord] = field(default_factory=list)
+    thread_links: list[LinkRecord] = field(default_factory=list)
+    thread_text: str = ""
+    truncated: bool = False
+
+    def to_model(self) -> Tweet:
+        return Tweet(
+            text=self.text,
+            user_name=self.user_name,
+            user_handle=self.user_handle,
+            tweet_url=self.tweet_url,
+            timestamp=self.timestamp,
+            links=[lnk.to_model() for lnk in self.links],
+            quoted_text=self.quoted_text,
+            quoted_user=self.quoted_user,
+            quoted_url=self.quoted_url,
+            quoted_links=[lnk.to_model() for lnk in self.quoted_links],
+            thread_links=[lnk.to_model() for lnk in self.thread_links],
+            thread_text=self.thread_text,
+            truncated=self.truncated,
+        )
+
+    def to_dict(self) -> dict:
+        """The same dict as ``self.to_model().model_dump()``, without building the model."""
+        return {
+            "text": self.text,
+            "user_name": self.user_name,
+            "user_handle": self.user_handle,
+            "tweet_url": self.tweet_url,
+            "timestamp": self.timestamp,
+            "links": [lnk.to_dict() for lnk in self.links],
+            "quoted_text": self.quoted_text,
+            "quoted_user": self.quoted_user,
+            "quoted_url": self.quoted_url,
+            "quoted_links": [lnk.to_dict() for lnk in self.quoted_links],
+            "thread_links": [lnk.to_dict() for lnk in self.thread_links],
+            "thread_text": self.thread_text,
+            "truncated": self.truncated,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TweetRecord":
+        """Inverse of ``to_dict``, for data this package wrote."""
+        def links(items: list[dict]) -> list[LinkRecord]:
+            return [LinkRecord(**lnk) for lnk in items]
+
+        return cls(**{
+            **data,
+            "links": links(data.get("links", [])),
+            "quoted_links": links(data.get("quoted_links", [])),
+            "thread_links": links(data.get("thread_links", [])),
+        })
+
+
+class Throttle(BaseModel):
+    url: str
+    reason: str  # "HTTP 429" or "rate limit notice"
+    backoff: float  # seconds the account's tabs were held back
+
+
+class Skipped(BaseModel):
+    url: str
+    kind: str  # "truncated", "quote", "thread" or "timeline"
+    error: str
+
+
+class RunStats(BaseModel):
+    scrolls: int = Field(0, exclude=True)  # all timelines; reported as BookmarksResult.scrolls_performed
+    scroll_waits: list[float] = []  # seconds waited after each scroll (adaptive pacing)
+    already_stored: int = 0  # --sync: tweets skipped because they were in the store
+    cache_hits: int = 0  # follow-up visits answered from the on-disk cache
+    cache_misses: int = 0
+    page_loads: int = 0  # tweet pages loaded by follow-up visits
+    navigations_saved: int = 0  # follow-ups served by a page already loaded for another
+    threads_shared: int = 0  # thread visits saved: the conversation was already loaded
+    blocked_requests: dict[str, int] = {}  # aborted by the resource policy, per resource type
+    redirects: dict[str, int] = {}  # --resolve-tco: short links cached, resolved or failed
+    throttles: list[Throttle] = []  # rate limits hit, each followed by a backoff
+    skipped: list[Skipped] = []  # follow-ups and timelines given up on, with the error
+    # Running totals of the two lists, still whole once a watch trims them
+    throttle_count: int = Field(0, exclude=True)
+    backoff_total: float = Field(0.0, exclude=True)
+    skipped_counts: dict[str, int] = Field({}, exclude=True)  # per kind
+
+
 class BookmarksResult(BaseModel):
     tweets: list[Tweet]
     total_scraped: int
     scrolls_performed: int
+    stats: RunStats = Field(default_factory=RunStats)
 
 
 class SearchResult(BaseModel):
@@ -38,3 +175,11 @@ class SearchResult(BaseModel):
     filter: str = "top"
     tweets: list[Tweet]
     total_scraped: int
+    stats: RunStats = Field(default_factory=RunStats)
+
+
+class BatchSearchResult(BaseModel):
+    filter: str = "top"
+    results: list[SearchResult]
+    total_scraped: int
+    stats: RunStats = Field(default_factory=RunStats)
@@ -0,0 +1,249 @@
+"""GraphQL response capture: build tweets from X's own timeline JSON."""
+
+import asyncio
+import html
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+from playwright.async_api import Page, Response
+
+from .links import classify_domain
+from .models import LinkRecord, TweetRecord
+
+BOOKMARKS_OPERATION = "Bookmarks"
+SEARCH_OPERATION = "SearchTimeline"
+TWEET_DETAIL_OPERATION = "TweetDetail"
+
+
+def graphql_operation(url: str) -> str | None:
+    """Return the operation name of an ``/i/api/graphql/<id>/<Operation>`` URL."""
+    parts = urlparse(url).path.split("/")
+    if len(parts) >= 6 and parts[1:4] == ["i", "api", "graphql"]:
+        return parts[5]
+    return None
+
+
+class ResponseCapture:
+    """Collects JSON bodies of GraphQL responses for the given operations.
+
+    Attach before navigating. Works the same for live responses and for
+    responses fulfilled from fixtures with ``page.route``.
+    """
+
+    def __init__(self, page: Page, operations: Iterable[str]) -> None:
+        self._page = page
+        self._operations = set(operations)
+        self._pending: set[asyncio.Task] = set()
+        self._payloads: list[dict] = []
+        page.on("response", self._on_response)
+
+    def _on_response(self, response: Response) -> None:
+        if graphql_operation(response.url) not in self._operations:
+            return
+        task = asyncio.ensure_future(self._read(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response: Response) -> None:
+        try:
+            self._payloads.append(await response.json())
+        except Exception:
+            pass
+
+    async def take(self) -> list[dict]:
+        """Wait for in-flight bodies, then return and clear captured payloads."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        payloads, self._payloads = self._payloads, []
+        return payloads
+
+    def detach(self) -> None:
+        self._page.remove_listener("response", self._on_response)
+
+
+class ThrottleWatch:
+    """Counts HTTP 429 responses a page receives from X while attached."""
+
+    def __init__(self, page: Page) -> None:
+        self._page = page
+        self._hits = 0
+        page.on("response", self._on_response)
+
+    def _on_response(self, response: Response) -> None:
+        if response.status == 429 and (urlparse(response.url).hostname or "").endswith("x.com"):
+            self._hits += 1
+
+    def take(self) -> int:
+        """Return and clear the number of 429s seen since the last call."""
+        hits, self._hits = self._hits, 0
+        return hits
+
+    def detach(self) -> None:
+        self._page.remove_listener("response", self._on_response)
+
+
+def _iter_tweet_results(node) -> Iterator[dict]:
+    """Yield timeline tweet results in document order.
+
+    Only ``itemContent`` entries count, so quoted tweets nested inside a
+    result are not reported as timeline tweets of their own.
+    """
+    if isinstance(node, dict):
+        content = node.get("itemContent")
+        if isinstance(content, dict) and "tweet_results" in content:
+            result = content["tweet_results"].get("result")
+            if result:
+                yield result
+            return
+        for value in node.values():
+            yield from _iter_tweet_results(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_tweet_results(value)
+
+
+def _unwrap(result: dict | None) -> dict | None:
+    """Strip visibility wrappers; return None for tombstones and unavailable tweets."""
+    if not result:
+        return None
+    if result.get("__typename") == "TweetWithVisibilityResults":
+        result = result.get("tweet")
+    if not result or "legacy" not in result:
+        return None
+    return result
+
+
+def _user(result: dict) -> tuple[str, str]:
+    """Return (name, screen_name) across old and new user result layouts."""
+    user = result.get("core", {}).get("user_results", {}).get("result", {})
+    core = user.get("core", {})
+    legacy = user.get("legacy", {})
+    name = core.get("name") or legacy.get("name", "")
+    screen_name = core.get("screen_name") or legacy.get("screen_name", "")
+    return name, screen_name
+
+
+def _timestamp(created_at: str | None) -> str | None:
+    """Convert ``Wed Oct 10 20:19:24 +0000 2018`` to the ISO form the DOM uses."""
+    if not created_at:
+        return None
+    try:
+        parsed = datetime.strptime(created_at, "%a %b %d %H:%M:%S %z %Y")
+    except ValueError:
+        return None
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _text_and_urls(result: dict) -> tuple[str, list[dict]]:
+    """Full text with t.co links expanded, plus the URL entities.
+
+    Long-form ("note") tweets carry their untruncated text separately.
+    """
+    legacy = result["legacy"]
+    note = result.get("note_tweet", {}).get("note_tweet_results", {}).get("result")
+    if note:
+        text = note.get("text", "")
+        urls = note.get("entity_set", {}).get("urls", [])
+    else:
+        text = legacy.get("full_text", "")
+        start, end = legacy.get("display_text_range", [0, len(text)])
+        text = text[start:end]
+        urls = legacy.get("entities", {}).get("urls", [])
+
+    for url in urls:
+        if url.get("url") and url.get("expanded_url"):
+            text = text.replace(url["url"], url["expanded_url"])
+    for media in legacy.get("entities", {}).get("media", []):
+        if media.get("url"):
+            text = text.replace(media["url"], "")
+    return html.unescape(text).strip(), urls
+
+
+def _links(urls: list[dict]) -> list[LinkRecord]:
+    links = []
+    seen = set()
+    for url in urls:
+        expanded = url.get("expanded_url") or url.get("url", "")
+        if not expanded or expanded in seen:
+            continue
+        seen.add(expanded)
+        domain, category = classify_domain(expanded)
+        links.append(LinkRecord(
+            href=url.get("url") or expanded,
+            text=url.get("display_url", ""),
+            resolved_url=expanded,
+            domain=domain,
+            category=category,
+        ))
+    return links
+
+
+def _status_url(result: dict) -> str:
+    _, screen_name = _user(result)
+    rest_id = result.get("rest_id") or result["legacy"].get("id_str", "")
+    if not screen_name or not rest_id:
+        return ""
+    return f"https://x.com/{screen_name}/status/{rest_id}"
+
+
+def result_to_tweet(result: dict) -> TweetRecord | None:
+    """Build a tweet from a GraphQL tweet result, quoted tweet included."""
+    result = _unwrap(result)
+    if result is None:
+        return None
+
+    name, screen_name = _user(result)
+    text, urls = _text_and_urls(result)
+    tweet = TweetRecord(
+        text=text,
+        user_name=name,
+        user_handle=f"@{screen_name}" if screen_name else "",
+        tweet_url=_status_url(result),
+        timestamp=_timestamp(result["legacy"].get("created_at")),
+        links=_links(urls),
+    )
+
+    quoted = _unwrap(result.get("quoted_status_result", {}).get("result"))
+    if quoted is not None:
+        _, quoted_screen_name = _user(quoted)
+        quoted_text, quoted_urls = _text_and_urls(quoted)
+        tweet.quoted_text = quoted_text
+        tweet.quoted_user = f"@{quoted_screen_name}" if quoted_screen_name else ""
+        tweet.quoted_url = _status_url(quoted)
+        tweet.quoted_links = _links(quoted_urls)
+    return tweet
+
+
+def parse_tweets(payload: dict) -> list[TweetRecord]:
+    """All timeline tweets in a Bookmarks/SearchTimeline/TweetDetail payload."""
+    tweets = []
+    for result in _iter_tweet_results(payload):
+        tweet = result_to_tweet(result)
+        if tweet is not None and tweet.tweet_url:
+            tweets.append(tweet)
+    return tweets
+
+
+def parse_thread(
+    payloads: Iterable[dict], handle: str
+) -> tuple[list[LinkRecord], list[str], list[str]]:
+    """Links, texts and status URLs of ``handle``'s own tweets in TweetDetail payloads."""
+    handle = handle.lower()
+    links: list[LinkRecord] = []
+    texts: list[str] = []
+    seen_urls: dict[str, None] = {}  # insertion-ordered set
+    seen_links: set[str] = set()
+    for payload in payloads:
+        for tweet in parse_tweets(payload):
+            if tweet.user_handle.lower() != handle or tweet.tweet_url in seen_urls:
+                continue
+            seen_urls[tweet.tweet_url] = None
+            if tweet.text:
+                texts.append(tweet.text)
+            for lnk in tweet.links:
+                if lnk.resolved_url in seen_links:
+                    continue
+                seen_links.add(lnk.resolved_url)
+                links.append(lnk)
+    return links, texts, list(seen_urls)
@@ -1,14 +1,17 @@
 """Output formatting: JSON and rich tables."""
 
 import json
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.table import Table
+from .links import paper_index, tweet_paper_ids
+from .models import BatchSearchResult, BookmarksResult, RunStats, SearchResult, Tweet, TweetRecord
+from .profiling import Profiler, span
 
-from .models import BookmarksResult, SearchResult, Tweet
+if TYPE_CHECKING:
+    from rich.console import Console
 
 
-def _tweet_summary(tweet: Tweet) -> dict:
+def _tweet_summary(tweet: Tweet | TweetRecord) -> dict:
     """Compact tweet dict for JSON output."""
     d = {
         "user": tweet.user_handle,
@@ -36,22 +39,112 @@ def _tweet_summary(tweet: Tweet) -> dict:
     return d
 
 
-def format_json(result: BookmarksResult | SearchResult) -> str:
-    """Format result as JSON string."""
-    tweets = [_tweet_summary(t) for t in result.tweets]
-    data: dict = {"total": result.total_scraped, "tweets": tweets}
-    if isinstance(result, SearchResult):
-        data["query"] = result.query
-        data["filter"] = result.filter
-    return json.dumps(data, indent=2)
+def _all_tweets(result: BookmarksResult | SearchResult | BatchSearchResult) -> list[Tweet]:
+    if isinstance(result, BatchSearchResult):
+        return [t for r in result.results for t in r.tweets]
+    return result.tweets
 
 
-def format_pretty(result: BookmarksResult | SearchResult) -> None:
-    """Print result as a rich table."""
+def format_json(result: BookmarksResult | SearchResult | BatchSearchResult) -> str:
+    """Format result as JSON string.
+
+    Batch results are one combined tweet list, each tweet tagged with its query.
+    ``papers`` indexes the paper IDs found in the tweets to the tweets' URLs.
+    """
+    with span("format_json"):
+        if isinstance(result, BatchSearchResult):
+            tweets = [
+                {**_tweet_summary(t), "query": r.query} for r in result.results for t in r.tweets
+            ]
+        else:
+            tweets = [_tweet_summary(t) for t in result.tweets]
+        data: dict = {"total": result.total_scraped, "tweets": tweets}
+        with span("paper_index"):
+            papers = paper_index(_all_tweets(result))
+        if papers:
+            data["papers"] = papers
+        if isinstance(result, BatchSearchResult):
+            data["queries"] = [r.query for r in result.results]
+            data["filter"] = result.filter
+        elif isinstance(result, SearchResult):
+            data["query"] = result.query
+            data["filter"] = result.filter
+        stats = result.stats.model_dump(exclude_defaults=True)
+        if stats:
+            data["stats"] = stats
+        return json.dumps(data, indent=2)
+
+
+def format_ndjson_line(tweet: Tweet | TweetRecord, query: str | None = None) -> str:
+    """Format one tweet as a compact single-line JSON record."""
+    with span("format_ndjson"):
+        d = _tweet_summary(tweet)
+        if query is not None:
+            d["query"] = query
+        papers = tweet_paper_ids(tweet)
+        if papers:
+            d["papers"] = papers
+        return json.dumps(d, separators=(",", ":"))
+
+
+def format_pretty(result: BookmarksResult | SearchResult | BatchSearchResult) -> None:
+    """Print result as a rich table, one per query for batch results."""
+    from rich.console import Console
+
     console = Console()
 
-    if isinstance(result, SearchResult):
-        console.print(f"\n[bold]Search: {result.query}[/bold] ({result.filter})")
+    with span("format_pretty"):
+        if isinstance(result, BatchSearchResult):
+            for search_result in result.results:
+                console.print(f"\n[bold]Search: {search_result.query}[/bold] ({search_result.filter})")
+                _print_table(console, search_result.tweets)
+        else:
+            if isinstance(result, SearchResult):
+                console.print(f"\n[bold]Search: {result.query}[/bold] ({result.filter})")
+            _print_table(console, result.tweets)
+
+        _print_papers(console, paper_index(_all_tweets(result)))
+        console.print(f"\n[bold]{result.total_scraped}[/bold] tweets scraped")
+        stats = result.stats
+        waits = stats.scroll_waits
+        if waits:
+            console.print(
+                f"[dim]scroll waits: {len(waits)} scrolls, "
+                f"avg {sum(waits) / len(waits):.2f}s, max {max(waits):.2f}s[/dim]"
+            )
+        if stats.cache_hits or stats.cache_misses:
+            console.print(f"[dim]follow-up cache: {stats.cache_hits} hits, {stats.cache_misses} misses[/dim]")
+        if stats.page_loads or stats.navigations_saved:
+            console.print(
+                f"[dim]follow-up page loads: {stats.page_loads} "
+                f"({stats.navigations_saved} navigations saved)[/dim]"
+            )
+        if stats.threads_shared:
+            console.print(f"[dim]thread visits shared within a conversation: {stats.threads_shared}[/dim]")
+        if stats.blocked_requests:
+            blocked = ", ".join(f"{n} {kind}" for kind, n in sorted(stats.blocked_requests.items()))
+            console.print(f"[dim]blocked requests: {blocked}[/dim]")
+        if stats.redirects:
+            counts = ", ".join(f"{n} {kind}" for kind, n in sorted(stats.redirects.items()))
+            console.print(f"[dim]t.co redirects: {counts}[/dim]")
+        summary = format_rate_limits(stats)
+        if summary:
+            console.print(f"[yellow]{summary}[/yellow]")
+
+
+def format_rate_limits(stats: RunStats) -> str | None:
+    """One line on throttle backoffs and skipped items, or None if there were none."""
+    parts = []
+    if stats.throttle_count:
+        parts.append(f"rate limited {stats.throttle_count} times, backed off {stats.backoff_total:.0f}s")
+    if stats.skipped_counts:
+        kinds = stats.skipped_counts
+        parts.append("skipped " + ", ".join(f"{n} {kind}" for kind, n in sorted(kinds.items())))
+    return "; ".join(parts) or None
+
+
+def _print_table(console: "Console", tweets: list[Tweet]) -> None:
+    from rich.table import Table
 
     table = Table(show_lines=True)
     table.add_column("#", style="dim", width=4)
@@ -59,7 +152,7 @@ def format_pretty(result: BookmarksResult | SearchResult) -> None:
     table.add_column("Tweet", width=50)
     table.add_column("Links", width=40)
 
-    for i, tweet in enumerate(result.tweets, 1):
+    for i, tweet in enumerate(tweets, 1):
         all_links = tweet.links + tweet.quoted_links + tweet.thread_links
         link_strs = []
         for lnk in all_links:
@@ -75,4 +168,29 @@ def format_pretty(result: BookmarksResult | SearchResult) -> None:
         )
 
     console.print(table)
-    console.print(f"\n[bold]{result.total_scraped}[/bold] tweets scraped")
+
+
+def _print_papers(console: "Console", papers: dict[str, list[str]]) -> None:
+    if not papers:
+        return
+    from rich.table import Table
+
+    table = Table(title="Papers")
+    table.add_column("Paper", style="cyan")
+    table.add_column("Tweets", justify="right")
+    for paper_id, urls in sorted(papers.items(), key=lambda item: -len(item[1])):
+        table.add_row(paper_id, str(len(urls)))
+    console.print(table)
+
+
+def format_profile(profiler: Profiler) -> str:
+    """Per-phase timing table: count, total, p50 and p95 seconds."""
+    rows = profiler.summary()
+    width = max([len("phase")] + [len(row["phase"]) for row in rows])
+    lines = [f"{'phase':<{width}}  {'count':>6}  {'total':>9}  {'p50':>8}  {'p95':>8}"]
+    for row in rows:
+        lines.append(
+            f"{row['phase']:<{width}}  {row['count']:>6}  {row['total']:>8.3f}s"
+            f"  {row['p50']:>7.3f}s  {row['p95']:>7.3f}s"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,88 @@
+"""Shared pacing budget for page actions (navigations and scrolls), with rate-limit backoff."""
+
+import asyncio
+import time
+from contextvars import ContextVar
+
+from .config import BACKOFF_BASE, BACKOFF_MAX
+from .profiling import span
+
+
+class RateLimited(Exception):
+    """X is throttling the account: an HTTP 429 or its on-page rate-limit notice."""
+
+    def __init__(self, url: str, reason: str) -> None:
+        super().__init__(f"rate limited ({reason})")
+        self.url = url
+        self.reason = reason
+
+
+class TokenBucket:
+    """Allows ``rate`` actions per second on average, with bursts up to ``burst``.
+
+    Waiters are served in arrival order, so every page drawing from the same
+    bucket gets a fair share of the budget. ``rate=None`` sets no pace of its
+    own; the bucket then only holds everyone back while ``pause``d.
+    """
+
+    def __init__(self, rate: float | None = None, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every acquire for ``seconds`` from now; the longest pause wins."""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while (paused := self._resume_at - time.monotonic()) > 0:
+                await asyncio.sleep(paused)
+            if self.rate is None:
+                return
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+_budget: ContextVar[TokenBucket | None] = ContextVar("pacing_budget", default=None)
+
+
+def set_budget(bucket: TokenBucket | None) -> None:
+    """Install the bucket used by ``pace`` in this task and tasks it starts."""
+    _budget.set(bucket)
+
+
+async def pace() -> None:
+    """Wait for the shared budget, if one is installed, before a page action."""
+    bucket = _budget.get()
+    if bucket is not None:
+        with span("pace"):
+            await bucket.acquire()
+
+
+async def back_off(attempt: int) -> float:
+    """Back off before retry ``attempt`` (0-based) after a RateLimited; return the delay.
+
+    The delay doubles per attempt. With a budget installed it pauses the
+    whole budget, so every tab sharing it waits at its next ``pace``;
+    otherwise only the caller sleeps.
+    """
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt)
+    bucket = _budget.get()
+    if bucket is not None:
+        bucket.pause(delay)
+    else:
+        with span("sleep:backoff"):
+            await asyncio.sleep(delay)
+    return delay
@@ -0,0 +1,80 @@
+"""Bounded pool of browser tabs for concurrent follow-up visits."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+from playwright.async_api import BrowserContext, Page
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class PagePool:
+    """Up to ``size`` tabs in one BrowserContext, shared by follow-up visits.
+
+    Tabs are opened lazily and reused. Pages passed in via ``pages`` belong to
+    the caller: they are lent to the pool but never closed by it.
+    """
+
+    def __init__(self, context: BrowserContext, size: int, *, pages: Iterable[Page] = ()) -> None:
+        self._context = context
+        self._lent = list(pages)
+        self._size = max(1, size, len(self._lent))
+        self._opened: list[Page] = []
+        self._count = len(self._lent)
+        self._idle: asyncio.Queue[Page] = asyncio.Queue()
+        for page in self._lent:
+            self._idle.put_nowait(page)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    async def acquire(self) -> Page:
+        """Take an idle tab, opening a new one while under the size limit."""
+        if self._idle.empty() and self._count < self._size:
+            self._count += 1
+            try:
+                page = await self._context.new_page()
+            except BaseException:
+                self._count -= 1
+                raise
+            self._opened.append(page)
+            return page
+        return await self._idle.get()
+
+    def release(self, page: Page) -> None:
+        """Return a tab to the pool."""
+        self._idle.put_nowait(page)
+
+    async def map(
+        self,
+        fn: Callable[[Page, T], Awaitable[R]],
+        items: Iterable[T],
+    ) -> list[R | Exception]:
+        """Run ``fn(page, item)`` for every item across the pool.
+
+        Results come back in input order. A visit that raises yields its
+        exception in place of a result so one bad tweet doesn't sink the batch.
+        """
+
+        async def run(item: T) -> R | Exception:
+            page = await self.acquire()
+            try:
+                return await fn(page, item)
+            except Exception as exc:
+                return exc
+            finally:
+                self.release(page)
+
+        return await asyncio.gather(*(run(item) for item in items))
+
+    async def close(self) -> None:
+        """Close the tabs this pool opened."""
+        for page in self._opened:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self._opened.clear()
@@ -0,0 +1,97 @@
+"""Per-phase timers: summary statistics and Chrome trace-event output."""
+
+import asyncio
+import json
+import math
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+class Profiler:
+    """Records named spans with the asyncio task they ran in.
+
+    Spans of one phase may overlap across tasks (follow-up tabs run
+    concurrently), so a phase's total can exceed the wall time of the run.
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self.spans: list[tuple[str, float, float, str]] = []
+
+    def record(self, name: str, start: float, end: float) -> None:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        lane = task.get_name() if task is not None else "main"
+        self.spans.append((name, start - self._origin, end - start, lane))
+
+    def summary(self) -> list[dict]:
+        """Count, total, p50 and p95 seconds per phase, slowest total first."""
+        durations: dict[str, list[float]] = {}
+        for name, _, duration, _ in self.spans:
+            durations.setdefault(name, []).append(duration)
+        rows = []
+        for name, values in durations.items():
+            values.sort()
+            rows.append({
+                "phase": name,
+                "count": len(values),
+                "total": sum(values),
+                "p50": _percentile(values, 0.50),
+                "p95": _percentile(values, 0.95),
+            })
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def write_trace(self, path: Path) -> None:
+        """Write spans as Chrome trace events (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        lanes: dict[str, int] = {}
+        events = []
+        for name, start, duration, lane in self.spans:
+            tid = lanes.setdefault(lane, len(lanes))
+            events.append({
+                "name": name,
+                "cat": name.split(":", 1)[0],
+                "ph": "X",
+                "ts": round(start * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+                "pid": pid,
+                "tid": tid,
+            })
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": lane}}
+            for lane, tid in lanes.items()
+        )
+        path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+
+_profiler: ContextVar[Profiler | None] = ContextVar("profiler", default=None)
+
+
+def set_profiler(profiler: Profiler | None) -> None:
+    """Install the profiler used by ``span`` in this context and tasks it starts."""
+    _profiler.set(profiler)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the enclosed block as phase ``name`` if a profiler is installed."""
+    profiler = _profiler.get()
+    if profiler is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record(name, start, time.perf_counter())
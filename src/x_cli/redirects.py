@@ -0,0 +1,168 @@
+"""t.co redirect resolution: concurrent HEAD requests on keep-alive connections."""
+
+import http.client
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+from .config import (
+    DEFAULT_RESOLVE_WORKERS,
+    REDIRECT_CACHE_FILE,
+    REDIRECT_MAX_HOPS,
+    REDIRECT_TIMEOUT,
+    SHORTENER_HOSTS,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS redirects (
+    url         TEXT PRIMARY KEY,
+    target      TEXT NOT NULL,
+    resolved_at REAL NOT NULL
+);
+"""
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# t.co answers browsers with an HTML page and plain clients with a 301.
+_HEADERS = {"User-Agent": "x-cli", "Connection": "keep-alive"}
+
+
+class RedirectResolver:
+    """Follows shortener redirects with HEAD requests and caches the targets.
+
+    Up to ``workers`` threads resolve at once; each keeps one keep-alive
+    connection per host, so at most ``workers`` connections are open to any
+    host. Redirects are followed while they point at ``shortener_hosts``;
+    the first other URL is the target. Targets are kept forever in SQLite
+    since t.co mappings never change. Failures are not cached.
+    """
+
+    def __init__(
+        self,
+        path: Path = REDIRECT_CACHE_FILE,
+        *,
+        workers: int = DEFAULT_RESOLVE_WORKERS,
+        timeout: float = REDIRECT_TIMEOUT,
+        shortener_hosts: Iterable[str] = SHORTENER_HOSTS,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.shortener_hosts = frozenset(h.lower() for h in shortener_hosts)
+        self.counts: Counter[str] = Counter()
+        self._local = threading.local()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="redirects")
+        self._open: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+
+    def __enter__(self) -> "RedirectResolver":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.shutdown()
+        with self._lock:
+            for conn in self._open:
+                conn.close()
+            self._open.clear()
+        self._conn.close()
+
+    def is_short(self, url: str) -> bool:
+        return (urlsplit(url).hostname or "").lower() in self.shortener_hosts
+
+    def resolve_many(self, urls: Iterable[str]) -> dict[str, str]:
+        """Map each short URL to its target; unresolvable URLs are left out.
+
+        Blocks until done; safe to call from several threads at once.
+        """
+        wanted = list(dict.fromkeys(u for u in urls if self.is_short(u)))
+        targets: dict[str, str] = {}
+        misses = []
+        with self._db_lock:
+            for url in wanted:
+                row = self._conn.execute(
+                    "SELECT target FROM redirects WHERE url = ?", (url,)
+                ).fetchone()
+                if row is not None:
+                    targets[url] = row[0]
+                else:
+                    misses.append(url)
+            self.counts["cached"] += len(targets)
+        if not misses:
+            return targets
+
+        resolved = list(self._pool.map(self._resolve, misses))
+        now = time.time()
+        found = [(url, target, now) for url, target in zip(misses, resolved) if target is not None]
+        with self._db_lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO redirects (url, target, resolved_at) VALUES (?, ?, ?)", found
+            )
+            self.counts["resolved"] += len(found)
+            self.counts["failed"] += len(misses) - len(found)
+        targets.update((url, target) for url, target, _ in found)
+        return targets
+
+    def _resolve(self, url: str) -> str | None:
+        current = url
+        for _ in range(REDIRECT_MAX_HOPS):
+            location = self._head(current)
+            if location is None:
+                return None
+            current = urljoin(current, location)
+            if not self.is_short(current):
+                return current
+        return None
+
+    def _head(self, url: str) -> str | None:
+        """Location header of a redirect response for ``url``, else None.
+
+        A kept-alive connection the server has since closed gets one retry
+        on a fresh connection.
+        """
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        for attempt in range(2):
+            conn = self._connection(parts.scheme, parts.netloc, fresh=attempt > 0)
+            try:
+                conn.request("HEAD", path, headers=_HEADERS)
+                resp = conn.getresponse()
+                resp.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                continue
+            if resp.will_close:
+                conn.close()
+            if resp.status in _REDIRECT_STATUSES:
+                return resp.getheader("Location")
+            return None
+        return None
+
+    def _connection(self, scheme: str, netloc: str, *, fresh: bool) -> http.client.HTTPConnection:
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        key = (scheme, netloc)
+        conn = conns.get(key)
+        if conn is None or fresh:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            new = cls(netloc, timeout=self.timeout)
+            with self._lock:
+                if conn is not None:
+                    conn.close()
+                    self._open.remove(conn)
+                self._open.append(new)
+            conn = conns[key] = new
+        return conn
@@ -1,39 +1,106 @@
 """Core scraping logic: scroll loop, tweet extraction, quote/thread following."""
 
+import asyncio
+import sys
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import aclosing
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from typing import TypeVar
 
-from playwright.sync_api import Page
+from playwright.async_api import BrowserContext, Page, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from .cache import FollowupCache
+from .checkpoint import Checkpoint
 from .config import (
     BOOKMARKS_URL,
+    DEFAULT_CONCURRENCY,
     DEFAULT_COUNT,
     DEFAULT_MAX_SCROLLS,
+    DEFAULT_SEARCH_PARALLEL,
     EMPTY_SCROLL_THRESHOLD,
     INITIAL_LOAD_PAUSE,
     NAV_TIMEOUT,
+    RATE_LIMIT_RETRIES,
     SCROLL_PAUSE,
+    SCROLL_SETTLE_PAUSE,
+    SCROLL_WAIT_CEILING,
     SEARCH_URL,
     SELECTOR_TIMEOUT,
+    STREAM_BUFFER,
+    SYNC_KNOWN_STREAK,
+    THREAD_MAX_SCROLLS,
+    THREAD_SCROLL_WAIT,
+    VISITED_LIMIT,
+    WATCH_INTERVAL,
+    WATCH_SEEN_LIMIT,
+    WATCH_STATS_LIMIT,
+    WATCH_TOP,
 )
-from .js import EXTRACT_SINGLE_TWEET_LINKS_JS, EXTRACT_THREAD_JS, EXTRACT_TWEETS_JS
-from .links import extract_arxiv_ids, resolve_link
-from .models import BookmarksResult, Link, SearchResult, Tweet
+from .js import (
+    ARTICLES_ADDED_JS,
+    EXTRACT_NEW_TWEETS_JS,
+    EXTRACT_SINGLE_TWEET_LINKS_JS,
+    EXTRACT_THREAD_JS,
+    EXTRACT_TOP_TWEETS_JS,
+    RATE_LIMITED_JS,
+    RETRY_TIMELINE_JS,
+    SHOW_NEW_TWEETS_JS,
+    TEXT_CONTENT_EXTRACTORS,
+    THREAD_SCROLL_JS,
+    WAIT_ARTICLES_ADDED_JS,
+)
+from .links import classify_domain, resolve_link
+from .models import (
+    BatchSearchResult,
+    BookmarksResult,
+    LinkRecord,
+    RunStats,
+    SearchResult,
+    Skipped,
+    Throttle,
+    Tweet,
+    TweetRecord,
+)
+from .network import (
+    BOOKMARKS_OPERATION,
+    SEARCH_OPERATION,
+    TWEET_DETAIL_OPERATION,
+    ResponseCapture,
+    ThrottleWatch,
+    parse_thread,
+    parse_tweets,
+)
+from .pacing import RateLimited, TokenBucket, back_off, pace, set_budget
+from .pool import PagePool
+from .profiling import span
+from .redirects import RedirectResolver
+from .store import TweetStore
 
+T = TypeVar("T")
 
-def _raw_to_tweet(raw: dict) -> Tweet:
-    """Convert raw JS tweet dict to Tweet model with resolved links."""
-    links = []
-    for lnk in raw.get("links", []):
+
+def _raw_to_link(lnk: dict) -> LinkRecord:
+    """Convert raw JS link dict to a link record with its resolved URL."""
+    with span("resolve_link"):
         resolved_url, domain, category = resolve_link(lnk["href"], lnk.get("text", ""))
-        links.append(Link(
-            href=lnk["href"],
-            text=lnk.get("text", ""),
-            resolved_url=resolved_url,
-            domain=domain,
-            category=category,
-        ))
-
-    return Tweet(
+    return LinkRecord(
+        href=lnk["href"],
+        text=lnk.get("text", ""),
+        resolved_url=resolved_url,
+        domain=domain,
+        category=category,
+    )
+
+
+def _raw_to_tweet(raw: dict) -> TweetRecord:
+    """Convert raw JS tweet dict to a tweet record with resolved links."""
+    links = [_raw_to_link(lnk) for lnk in raw.get("links", [])]
+
+    return TweetRecord(
         text=raw.get("text", ""),
         user_name=raw.get("user_name", ""),
         user_handle=raw.get("user_handle", ""),
@@ -47,158 +114,768 @@ def _raw_to_tweet(raw: dict) -> Tweet:
     )
 
 
-def _scroll_and_collect(
+async def _scroll(page: Page, pacing: str) -> float:
+    """Scroll down one step and wait for the timeline; return seconds waited.
+
+    ``fixed`` sleeps SCROLL_PAUSE. ``adaptive`` returns as soon as new tweet
+    articles are added to the DOM, or after SCROLL_WAIT_CEILING.
+    """
+    await pace()
+    start = time.monotonic()
+    if pacing == "adaptive":
+        with span("evaluate:articles_added"):
+            before = await page.evaluate(ARTICLES_ADDED_JS)
+        with span("evaluate:scroll"):
+            await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
+        try:
+            with span("wait_for_function:articles_added"):
+                await page.wait_for_function(
+                    WAIT_ARTICLES_ADDED_JS, arg=before, timeout=SCROLL_WAIT_CEILING * 1000
+                )
+            with span("sleep:scroll_settle"):
+                await asyncio.sleep(SCROLL_SETTLE_PAUSE)
+        except PlaywrightTimeoutError:
+            pass
+    else:
+        with span("evaluate:scroll"):
+            await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
+        with span("sleep:scroll_pause"):
+            await asyncio.sleep(SCROLL_PAUSE)
+    return time.monotonic() - start
+
+
+async def _rate_limit_notice(page: Page) -> bool:
+    with span("evaluate:rate_limited"):
+        return await page.evaluate(RATE_LIMITED_JS)
+
+
+def _check_status(response: Response | None, url: str) -> None:
+    if response is not None and response.status == 429:
+        raise RateLimited(url, "HTTP 429")
+
+
+async def _wait_for_articles(page: Page, url: str, phase: str) -> None:
+    """Wait for tweet articles; raise RateLimited if X shows its notice instead."""
+    try:
+        with span(f"wait_for_selector:{phase}"):
+            await page.wait_for_selector('article[data-testid="tweet"]', timeout=SELECTOR_TIMEOUT)
+    except PlaywrightTimeoutError:
+        if await _rate_limit_notice(page):
+            raise RateLimited(url, "rate limit notice") from None
+        raise
+
+
+async def _with_backoff(
+    url: str, action: Callable[[], Awaitable[T]], stats: RunStats | None
+) -> T:
+    """Run a page action, backing off and retrying while X rate-limits it.
+
+    Each backoff is recorded in ``stats``. After RATE_LIMIT_RETRIES of them
+    the last RateLimited is raised.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await action()
+        except RateLimited as exc:
+            if attempt >= RATE_LIMIT_RETRIES:
+                raise
+            delay = await back_off(attempt)
+            attempt += 1
+            _throttled(stats, exc.url, exc.reason, delay)
+
+
+def _throttled(stats: RunStats | None, url: str, reason: str, delay: float) -> None:
+    """Record a rate limit and the backoff that followed."""
+    if stats is None:
+        return
+    stats.throttles.append(Throttle(url=url, reason=reason, backoff=delay))
+    stats.throttle_count += 1
+    stats.backoff_total += delay
+
+
+def _skip(stats: RunStats | None, url: str, kind: str, exc: Exception) -> None:
+    """Record a follow-up or timeline given up on."""
+    if stats is None:
+        return
+    detail = str(exc).strip().splitlines()
+    error = f"{type(exc).__name__}: {detail[0]}" if detail else type(exc).__name__
+    stats.skipped.append(Skipped(url=url, kind=kind, error=error))
+    stats.skipped_counts[kind] = stats.skipped_counts.get(kind, 0) + 1
+
+
+async def _open_timeline(page: Page, url: str) -> None:
+    """Navigate to a timeline page and wait for the first tweets."""
+    await pace()
+    with span("goto:timeline"):
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
+    _check_status(response, url)
+    if "login" in page.url.lower():
+        raise RuntimeError("Auth expired. Run: x auth save")
+    await _wait_for_articles(page, url, "timeline")
+    with span("sleep:initial_load"):
+        await asyncio.sleep(INITIAL_LOAD_PAUSE)
+
+
+def _dom_js(script: str, source: str) -> str:
+    """An extractor from ``x_cli.js``, or its textContent build for ``source="dom-text"``."""
+    return TEXT_CONTENT_EXTRACTORS[script] if source == "dom-text" else script
+
+
+async def _iter_timeline(
     page: Page,
     *,
     max_count: int = DEFAULT_COUNT,
     max_scrolls: int = DEFAULT_MAX_SCROLLS,
-) -> tuple[list[Tweet], int]:
-    """Scroll loop that collects tweets, deduplicating by URL."""
+    pacing: str = "fixed",
+    source: str = "dom",
+    capture: ResponseCapture | None = None,
+    watch: ThrottleWatch | None = None,
+    known: Callable[[str], bool] | None = None,
+    claimed: Callable[[str], bool] | None = None,
+    stats: RunStats | None = None,
+) -> AsyncIterator[list[TweetRecord]]:
+    """Scroll loop that yields each batch of new tweets, deduplicating by URL.
+
+    With a ``capture``, tweets come from the timeline's GraphQL responses.
+    Otherwise the in-page extractor remembers what it has returned, so each
+    call only serializes articles that appeared since the previous scroll.
+
+    A scroll that brings nothing while X is rate-limiting (429s seen by
+    ``watch``, or its on-page notice) backs off and retries instead of
+    counting as empty; RateLimited is raised after RATE_LIMIT_RETRIES.
+
+    Tweets for which ``known(url)`` is true are skipped, and the loop stops
+    after SYNC_KNOWN_STREAK of them in a row. ``claimed(url)`` is asked last
+    and should claim the URL for this timeline, returning True if another
+    timeline already has it; such tweets are dropped but still count as
+    progress for the empty-scroll check.
+    """
+    extract_js = _dom_js(EXTRACT_NEW_TWEETS_JS, source)
     seen_urls: set[str] = set()
-    all_tweets: list[Tweet] = []
+    collected = 0
     empty_streak = 0
+    known_streak = 0
+    throttle_streak = 0
 
     for scroll_num in range(max_scrolls):
-        raw_tweets = page.evaluate(EXTRACT_TWEETS_JS)
-        new_count = 0
-        for raw in raw_tweets:
-            url = raw.get("tweet_url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                all_tweets.append(_raw_to_tweet(raw))
-                new_count += 1
-
-        if len(all_tweets) >= max_count:
+        if stats is not None:
+            stats.scrolls += 1  # summed over every timeline sharing the stats
+        if capture is not None:
+            payloads = await capture.take()
+            with span("parse:graphql"):
+                batch = [t for payload in payloads for t in parse_tweets(payload)]
+        else:
+            with span("evaluate:extract_new_tweets"):
+                raw_tweets = await page.evaluate(extract_js, scroll_num == 0)
+            batch = [_raw_to_tweet(raw) for raw in raw_tweets if raw.get("tweet_url")]
+        new_tweets = []
+        duplicates = 0
+        for tweet in batch:
+            if collected + len(new_tweets) >= max_count:
+                break
+            if tweet.tweet_url in seen_urls:
+                continue
+            seen_urls.add(tweet.tweet_url)
+            if known is not None and known(tweet.tweet_url):
+                known_streak += 1
+                if stats is not None:
+                    stats.already_stored += 1
+                continue
+            known_streak = 0
+            if claimed is not None and claimed(tweet.tweet_url):
+                duplicates += 1
+                continue
+            new_tweets.append(tweet)
+
+        collected += len(new_tweets)
+        if new_tweets:
+            yield new_tweets
+
+        if collected >= max_count or known_streak >= SYNC_KNOWN_STREAK:
             break
 
-        if new_count == 0:
+        throttled = watch.take() if watch is not None else 0
+        if new_tweets or duplicates:
+            empty_streak = throttle_streak = 0
+        elif throttled or await _rate_limit_notice(page):
+            reason = "HTTP 429" if throttled else "rate limit notice"
+            if throttle_streak >= RATE_LIMIT_RETRIES:
+                raise RateLimited(page.url, reason)
+            delay = await back_off(throttle_streak)
+            throttle_streak += 1
+            _throttled(stats, page.url, reason, delay)
+            await pace()  # a paused budget makes us wait out the backoff here
+            with span("evaluate:retry_timeline"):
+                await page.evaluate(RETRY_TIMELINE_JS)
+        else:
             empty_streak += 1
             if empty_streak >= EMPTY_SCROLL_THRESHOLD:
                 break
-        else:
-            empty_streak = 0
 
-        page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
-        time.sleep(SCROLL_PAUSE)
+        waited = await _scroll(page, pacing)
+        if stats is not None and pacing == "adaptive":
+            stats.scroll_waits.append(round(waited, 3))
 
-    return all_tweets[:max_count], scroll_num + 1
 
+async def _open_tweet_page(page: Page, url: str) -> None:
+    """Navigate a tab to a single tweet and wait for it to render."""
+    await pace()
+    with span("goto:tweet"):
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
+    _check_status(response, url)
+    await _wait_for_articles(page, url, "tweet")
+    with span("sleep:initial_load"):
+        await asyncio.sleep(INITIAL_LOAD_PAUSE)
 
-def _follow_truncated(page: Page, tweets: list[Tweet]) -> None:
-    """Navigate to individual tweet pages for truncated tweets to get full text and links."""
-    for tweet in tweets:
-        if not tweet.truncated or not tweet.tweet_url:
-            continue
-        try:
-            page.goto(tweet.tweet_url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
-            page.wait_for_selector('article[data-testid="tweet"]', timeout=SELECTOR_TIMEOUT)
-            time.sleep(INITIAL_LOAD_PAUSE)
-            data = page.evaluate(EXTRACT_SINGLE_TWEET_LINKS_JS)
-            # Update text with full version from individual page
-            if data.get("text"):
-                tweet.text = data["text"]
-            # Merge newly found links (dedup by href)
-            existing_hrefs = {lnk.href for lnk in tweet.links}
-            for lnk in data.get("links", []):
-                if lnk["href"] in existing_hrefs:
-                    continue
-                resolved_url, domain, category = resolve_link(lnk["href"], lnk.get("text", ""))
-                tweet.links.append(Link(
-                    href=lnk["href"],
-                    text=lnk.get("text", ""),
-                    resolved_url=resolved_url,
-                    domain=domain,
-                    category=category,
-                ))
-            tweet.truncated = False
-        except Exception:
-            continue
 
+def _merge_thread(thread: dict, articles: list[dict]) -> int:
+    """Add unseen author articles to ``thread``; return how many were new.
 
-def _follow_quotes(page: Page, tweets: list[Tweet]) -> None:
-    """Navigate to quoted tweets and extract their links."""
-    for tweet in tweets:
-        if not tweet.quoted_url or "x.com" not in tweet.quoted_url:
+    Links are deduplicated by href and text across the whole thread.
+    """
+    seen_urls = set(thread["urls"])
+    seen_links = {(lnk["href"], lnk["text"]) for lnk in thread["links"]}
+    new = 0
+    for article in articles:
+        url = article.get("url", "")
+        if url in seen_urls:
             continue
+        seen_urls.add(url)
+        thread["urls"].append(url)
+        new += 1
+        if article.get("text"):
+            thread["texts"].append(article["text"])
+        for lnk in article.get("links", []):
+            key = (lnk["href"], lnk["text"])
+            if key not in seen_links:
+                seen_links.add(key)
+                thread["links"].append(lnk)
+    return new
+
+
+async def _expand_thread(page: Page, read: Callable[[], Awaitable[int]]) -> None:
+    """Scroll a tweet page for as long as ``read`` keeps finding new author tweets.
+
+    ``read`` collects what the page shows now and returns how many author
+    tweets it hadn't seen. Stops after a read with none, at the bottom of
+    the page, when a scroll loads nothing within THREAD_SCROLL_WAIT, or
+    after THREAD_MAX_SCROLLS. The first read always finds the focal tweet,
+    so every page is scrolled at least once; unless that scroll hits the
+    bottom, a page with nothing more to load waits out THREAD_SCROLL_WAIT.
+    """
+    for _ in range(THREAD_MAX_SCROLLS):
+        if not await read():
+            return
+        with span("evaluate:articles_added"):
+            before = await page.evaluate(ARTICLES_ADDED_JS)
+        with span("evaluate:scroll"):
+            if await page.evaluate(THREAD_SCROLL_JS):
+                return
         try:
-            page.goto(tweet.quoted_url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
-            page.wait_for_selector('article[data-testid="tweet"]', timeout=SELECTOR_TIMEOUT)
-            time.sleep(INITIAL_LOAD_PAUSE)
-            data = page.evaluate(EXTRACT_SINGLE_TWEET_LINKS_JS)
-            for lnk in data.get("links", []):
-                resolved_url, domain, category = resolve_link(lnk["href"], lnk.get("text", ""))
-                tweet.quoted_links.append(Link(
-                    href=lnk["href"],
-                    text=lnk.get("text", ""),
-                    resolved_url=resolved_url,
-                    domain=domain,
-                    category=category,
-                ))
-        except Exception:
-            continue
+            with span("wait_for_function:articles_added"):
+                await page.wait_for_function(
+                    WAIT_ARTICLES_ADDED_JS, arg=before, timeout=THREAD_SCROLL_WAIT * 1000
+                )
+        except PlaywrightTimeoutError:
+            return
+        with span("sleep:scroll_settle"):
+            await asyncio.sleep(SCROLL_SETTLE_PAUSE)
+    await read()
 
 
-def _follow_threads(page: Page, tweets: list[Tweet]) -> None:
-    """For tweets with no links, navigate to tweet page and scan author replies."""
-    for tweet in tweets:
-        has_links = tweet.links or tweet.quoted_links or tweet.quoted_url
-        if has_links:
-            continue
-        if not tweet.tweet_url or not tweet.user_handle:
+async def _resolve_redirects(
+    redirects: RedirectResolver, tweets: list[TweetRecord], *, source: str
+) -> None:
+    """Replace t.co destinations the source didn't give with the targets the redirects point to.
+
+    DOM links only carry a guess from their anchor text. GraphQL links carry
+    X's expanded URL, so only those left unset or on a shortener are resolved.
+    """
+    links = [
+        lnk
+        for t in tweets
+        for lnk in (*t.links, *t.quoted_links, *t.thread_links)
+        if redirects.is_short(lnk.href)
+        and (source != "network" or not lnk.resolved_url or redirects.is_short(lnk.resolved_url))
+    ]
+    if not links:
+        return
+    targets = await asyncio.to_thread(redirects.resolve_many, [lnk.href for lnk in links])
+    for lnk in links:
+        target = targets.get(lnk.href)
+        if target:
+            lnk.resolved_url = target
+            lnk.domain, lnk.category = classify_domain(target)
+
+
+@dataclass(slots=True)
+class _Visit:
+    """The follow-up work one tweet page serves for a batch."""
+
+    url: str
+    full: list[TweetRecord] = field(default_factory=list)  # truncated tweets at this URL
+    quoted_by: list[TweetRecord] = field(default_factory=list)  # tweets quoting this URL
+    thread: TweetRecord | None = None  # link-less tweet whose author thread to scan
+
+
+class _Visited:
+    """Follow-up results by (kind, URL); past ``size`` the least recently used go."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._results: dict[tuple[str, str], dict] = {}  # oldest use first
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._results
+
+    def get(self, key: tuple[str, str]) -> dict | None:
+        data = self._results.pop(key, None)
+        if data is not None:
+            self._results[key] = data
+        return data
+
+    def add(self, key: tuple[str, str], data: dict) -> None:
+        self._results.pop(key, None)
+        self._results[key] = data
+        if len(self._results) > self._size:
+            del self._results[next(iter(self._results))]
+
+
+def _plan_visits(
+    tweets: list[TweetRecord],
+    *,
+    follow_quotes: bool,
+    follow_threads: bool,
+    source: str,
+) -> list[_Visit]:
+    """Group a batch's follow-up work by tweet page, one visit per distinct URL.
+
+    Truncated tweets need their full text, quoting tweets (DOM source only)
+    the quoted tweet's links, and link-less tweets their author's thread.
+    Whether a truncated tweet still needs its thread is decided during the
+    visit, once its full text is in.
+    """
+    visits: dict[str, _Visit] = {}
+
+    def visit(url: str) -> _Visit:
+        if url not in visits:
+            visits[url] = _Visit(url)
+        return visits[url]
+
+    for t in tweets:
+        if t.truncated and t.tweet_url:
+            visit(t.tweet_url).full.append(t)
+        if follow_quotes and source != "network" and t.quoted_url and "x.com" in t.quoted_url:
+            visit(t.quoted_url).quoted_by.append(t)
+        if (
+            follow_threads
+            and t.tweet_url
+            and t.user_handle
+            and not (t.links or t.quoted_links or t.quoted_url)
+        ):
+            visit(t.tweet_url).thread = t
+    return list(visits.values())
+
+
+def _apply_full_text(tweet: TweetRecord, data: dict) -> None:
+    if data.get("text"):
+        tweet.text = data["text"]
+    # Merge newly found links (dedup by href)
+    existing_hrefs = {lnk.href for lnk in tweet.links}
+    for lnk in data.get("links", []):
+        if lnk["href"] in existing_hrefs:
             continue
+        tweet.links.append(_raw_to_link(lnk))
+    tweet.truncated = False
+
+
+def _apply_thread(tweet: TweetRecord, data: dict, source: str) -> None:
+    if source == "network":
+        tweet.thread_links.extend(LinkRecord(**lnk) for lnk in data.get("links", []))
+    else:
+        tweet.thread_links.extend(_raw_to_link(lnk) for lnk in data.get("links", []))
+    tweet.thread_text = "\n".join(data.get("texts", [])[:10])
+
+
+async def _run_visit(
+    page: Page,
+    visit: _Visit,
+    *,
+    source: str,
+    cache: FollowupCache | None,
+    visited: _Visited,
+    stats: RunStats,
+) -> None:
+    """Load ``visit.url`` at most once and do all of its extractions there.
+
+    Results are looked up in ``visited`` (this run's earlier visits), then
+    the cache, and only then extracted from the page. A thread result is
+    registered under every status URL it saw, so other tweets of the same
+    conversation reuse it. Failures are recorded per need in ``stats.skipped``.
+    """
+    url = visit.url
+    loads = hits = served = 0
+    # dom-text results differ from dom ones, so they are cached apart
+    tweet_kind = "tweet-dom-text" if source == "dom-text" else "tweet"
+    thread_kind = {"network": "thread-network", "dom-text": "thread-dom-text"}.get(source, "thread")
+    capture = (
+        ResponseCapture(page, [TWEET_DETAIL_OPERATION])
+        if source == "network" and visit.thread is not None
+        else None
+    )
+
+    async def open_page() -> None:
+        nonlocal loads
+        if not loads:
+            await _with_backoff(url, lambda: _open_tweet_page(page, url), stats)
+            loads = 1
+
+    async def lookup(kind: str, extract: Callable[[], Awaitable[dict]]) -> dict:
+        nonlocal hits
+        data = visited.get((kind, url))
+        if data is not None:
+            return data
+        if cache is not None:
+            data = cache.get(kind, url)
+            hits += data is not None
+        if data is None:
+            await open_page()
+            data = await extract()
+            if cache is not None:
+                cache.put(kind, url, data)
+        visited.add((kind, url), data)
+        return data
+
+    async def extract_tweet() -> dict:
+        with span("evaluate:extract_single_tweet"):
+            return await page.evaluate(_dom_js(EXTRACT_SINGLE_TWEET_LINKS_JS, source))
+
+    async def extract_thread(handle: str) -> dict:
+        thread: dict = {"links": [], "texts": [], "urls": []}
+        payloads: list[dict] = []
+
+        async def read_dom() -> int:
+            with span("evaluate:extract_thread"):
+                articles = await page.evaluate(_dom_js(EXTRACT_THREAD_JS, source), handle)
+            return _merge_thread(thread, articles)
+
+        async def read_network() -> int:
+            payloads.extend(await capture.take())
+            with span("parse:graphql"):
+                links, texts, urls = parse_thread(payloads, handle)
+            seen = len(thread["urls"])
+            thread.update(links=[asdict(lnk) for lnk in links], texts=texts, urls=urls)
+            return len(urls) - seen
+
+        await _expand_thread(page, read_network if capture is not None else read_dom)
+        return thread
+
+    try:
+        if visit.full or visit.quoted_by:
+            try:
+                data = await lookup(tweet_kind, extract_tweet)
+            except Exception as exc:
+                for tweet in visit.full:
+                    _skip(stats, url, "truncated", exc)
+                for _ in visit.quoted_by:
+                    _skip(stats, url, "quote", exc)
+            else:
+                served += len(visit.full) + len(visit.quoted_by)
+                for tweet in visit.full:
+                    _apply_full_text(tweet, data)
+                for tweet in visit.quoted_by:
+                    tweet.quoted_links.extend(_raw_to_link(lnk) for lnk in data.get("links", []))
+
+        tweet = visit.thread
+        if tweet is not None and not tweet.links:
+            shared = (thread_kind, url) in visited
+            try:
+                data = await lookup(thread_kind, lambda: extract_thread(tweet.user_handle))
+            except Exception as exc:
+                _skip(stats, url, "thread", exc)
+            else:
+                served += 1
+                stats.threads_shared += shared
+                for status_url in data.get("urls", []):
+                    if (thread_kind, status_url) not in visited:
+                        visited.add((thread_kind, status_url), data)
+                _apply_thread(tweet, data, source)
+    finally:
+        if capture is not None:
+            capture.detach()
+        stats.page_loads += loads
+        stats.navigations_saved += max(0, served - loads - hits)
+
+
+async def _follow_up(
+    pool: PagePool,
+    tweets: list[TweetRecord],
+    *,
+    follow_quotes: bool,
+    follow_threads: bool,
+    source: str,
+    cache: FollowupCache | None,
+    redirects: RedirectResolver | None,
+    visited: _Visited | None = None,
+    stats: RunStats | None = None,
+) -> None:
+    """Follow up a batch of tweets over a pool of tabs, one load per distinct URL.
+
+    A truncated tweet's page yields its full text and, if it still has no
+    links, its thread in the same visit; a tweet quoted several times is
+    loaded once for all of them. Network-sourced tweets already carry full
+    text and quoted links, so only thread visits remain for them.
+
+    Pass the same ``visited`` across batches to reuse earlier results.
+    Visits with a thread to scan run one author at a time, so a thread
+    loaded for one tweet is found by the author's others. Visits that fail
+    are recorded in ``stats.skipped`` and leave their tweets as they were.
+    """
+    visited = visited if visited is not None else _Visited(VISITED_LIMIT)
+    stats = stats if stats is not None else RunStats()
+    visits = _plan_visits(
+        tweets, follow_quotes=follow_quotes, follow_threads=follow_threads, source=source
+    )
+
+    async def run_group(page: Page, group: list[_Visit]) -> None:
+        for visit in group:
+            await _run_visit(page, visit, source=source, cache=cache, visited=visited, stats=stats)
 
+    groups: dict[str, list[_Visit]] = {}
+    for visit in visits:
+        key = visit.thread.user_handle.lower() if visit.thread is not None else visit.url
+        groups.setdefault(key, []).append(visit)
+    with span("follow:visits"):
+        for result in await pool.map(run_group, list(groups.values())):
+            if isinstance(result, Exception):
+                print(f"Follow-up failed: {result}", file=sys.stderr)
+    if redirects is not None:
+        with span("follow:redirects"):
+            await _resolve_redirects(redirects, tweets, source=source)
+
+
+async def _iter_followed(
+    page: Page,
+    batches: AsyncIterator[list[TweetRecord]],
+    *,
+    follow_quotes: bool,
+    follow_threads: bool,
+    concurrency: int,
+    source: str,
+    cache: FollowupCache | None,
+    redirects: RedirectResolver | None,
+    pool: PagePool | None = None,
+    stats: RunStats | None = None,
+) -> AsyncIterator[TweetRecord]:
+    """Follow up batches as they arrive; yield finished tweets in timeline order.
+
+    Follow-ups run on their own tabs while ``page`` keeps scrolling. Once
+    STREAM_BUFFER tweets are waiting on follow-ups, scrolling pauses until
+    the oldest batch is done. A shared ``pool`` is used as is and left open.
+    """
+    own_pool = pool is None
+    if pool is None:
+        pool = PagePool(page.context, concurrency)
+    visited = _Visited(VISITED_LIMIT)
+    pending: deque[tuple[asyncio.Task, list[TweetRecord]]] = deque()
+    in_flight = 0
+    try:
+        async for batch in batches:
+            task = asyncio.create_task(_follow_up(
+                pool,
+                batch,
+                follow_quotes=follow_quotes,
+                follow_threads=follow_threads,
+                source=source,
+                cache=cache,
+                redirects=redirects,
+                visited=visited,
+                stats=stats,
+            ))
+            pending.append((task, batch))
+            in_flight += len(batch)
+            while pending and (pending[0][0].done() or in_flight > STREAM_BUFFER):
+                task, done = pending.popleft()
+                await task
+                in_flight -= len(done)
+                for tweet in done:
+                    yield tweet
+        while pending:
+            task, done = pending.popleft()
+            await task
+            for tweet in done:
+                yield tweet
+    finally:
+        for task, _ in pending:
+            task.cancel()
+        await asyncio.gather(*(task for task, _ in pending), return_exceptions=True)
+        if own_pool:
+            await pool.close()
+
+
+async def _with_checkpoint(
+    pending: list[TweetRecord],
+    batches: AsyncIterator[list[TweetRecord]],
+    checkpoint: Checkpoint,
+) -> AsyncIterator[list[TweetRecord]]:
+    """Replay unfinished checkpoint tweets first, then record each new batch."""
+    if pending:
+        yield pending
+    async for batch in batches:
+        checkpoint.add_collected(batch)
+        yield batch
+
+
+async def _iter_scrape(
+    page: Page,
+    url: str,
+    operation: str,
+    *,
+    count: int,
+    max_scrolls: int,
+    follow_quotes: bool,
+    follow_threads: bool,
+    concurrency: int,
+    pacing: str,
+    source: str,
+    cache: FollowupCache | None,
+    redirects: RedirectResolver | None,
+    known: Callable[[str], bool] | None = None,
+    claimed: Callable[[str], bool] | None = None,
+    pool: PagePool | None = None,
+    checkpoint: Checkpoint | None = None,
+    stats: RunStats,
+) -> AsyncIterator[TweetRecord]:
+    """Open a timeline, scroll it and stream its tweets through follow-ups.
+
+    With a ``checkpoint``, finished tweets are yielded straight from it,
+    unfinished ones are followed up before anything new, and the timeline
+    drops every status ID the checkpoint has already seen. The checkpoint
+    is saved on the way out, including on errors and Ctrl-C.
+    """
+    capture = ResponseCapture(page, [operation]) if source == "network" else None
+    watch = ThrottleWatch(page)
+    pending: list[TweetRecord] = []
+    if checkpoint is not None:
+        previous_claim = claimed
+
+        def claimed(url: str) -> bool:
+            return checkpoint.seen(url) or (previous_claim is not None and previous_claim(url))
+
+    async def timeline() -> AsyncIterator[list[TweetRecord]]:
+        if remaining <= 0:
+            return
         try:
-            page.goto(tweet.tweet_url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
-            page.wait_for_selector('article[data-testid="tweet"]', timeout=SELECTOR_TIMEOUT)
-            time.sleep(INITIAL_LOAD_PAUSE)
-
-            # Scroll to load thread replies
-            for _ in range(4):
-                page.evaluate("window.scrollBy(0, window.innerHeight)")
-                time.sleep(1)
-
-            data = page.evaluate(EXTRACT_THREAD_JS, tweet.user_handle)
-            for lnk in data.get("links", []):
-                resolved_url, domain, category = resolve_link(lnk["href"], lnk.get("text", ""))
-                tweet.thread_links.append(Link(
-                    href=lnk["href"],
-                    text=lnk.get("text", ""),
-                    resolved_url=resolved_url,
-                    domain=domain,
-                    category=category,
-                ))
-            tweet.thread_text = "\n".join(data.get("texts", [])[:10])
-        except Exception:
-            continue
+            await _with_backoff(url, lambda: _open_timeline(page, url), stats)
+            async for batch in _iter_timeline(
+                page,
+                max_count=remaining,
+                max_scrolls=max_scrolls,
+                pacing=pacing,
+                source=source,
+                capture=capture,
+                watch=watch,
+                known=known,
+                claimed=claimed,
+                stats=stats,
+            ):
+                yield batch
+        except RateLimited as exc:
+            _skip(stats, url, "timeline", exc)
+            print(f"Stopped scrolling {url}: {exc}", file=sys.stderr)
 
+    try:
+        remaining = count
+        if checkpoint is not None:
+            finished = checkpoint.finished()[:remaining]
+            for tweet in finished:
+                yield tweet
+            remaining -= len(finished)
+            pending = checkpoint.pending()[:remaining]
+            remaining -= len(pending)
 
-def scrape_bookmarks(
+        batches = timeline()
+        if checkpoint is not None:
+            batches = _with_checkpoint(pending, batches, checkpoint)
+        async with aclosing(_iter_followed(
+            page,
+            batches,
+            follow_quotes=follow_quotes,
+            follow_threads=follow_threads,
+            concurrency=concurrency,
+            source=source,
+            cache=cache,
+            redirects=redirects,
+            pool=pool,
+            stats=stats,
+        )) as records:
+            async for record in records:
+                if checkpoint is not None:
+                    checkpoint.mark_done(record)
+                yield record
+    finally:
+        if capture is not None:
+            capture.detach()
+        watch.detach()
+        if cache is not None:
+            stats.cache_hits, stats.cache_misses = cache.hits, cache.misses
+        if redirects is not None:
+            stats.redirects = dict(redirects.counts)
+        if checkpoint is not None:
+            checkpoint.save()
+
+
+async def iter_bookmarks(
     page: Page,
     *,
     count: int = DEFAULT_COUNT,
     max_scrolls: int = DEFAULT_MAX_SCROLLS,
     follow_quotes: bool = True,
     follow_threads: bool = True,
-) -> BookmarksResult:
-    """Scrape Twitter bookmarks."""
-    page.goto(BOOKMARKS_URL, wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
-    if "login" in page.url.lower():
-        raise RuntimeError("Auth expired. Run: x auth save")
-    page.wait_for_selector('article[data-testid="tweet"]', timeout=SELECTOR_TIMEOUT)
-    time.sleep(INITIAL_LOAD_PAUSE)
-
-    tweets, scrolls = _scroll_and_collect(page, max_count=count, max_scrolls=max_scrolls)
+    concurrency: int = DEFAULT_CONCURRENCY,
+    pacing: str = "fixed",
+    source: str = "dom",
+    store: TweetStore | None = None,
+    cache: FollowupCache | None = None,
+    redirects: RedirectResolver | None = None,
+    claimed: Callable[[str], bool] | None = None,
+    checkpoint: Checkpoint | None = None,
+    stats: RunStats | None = None,
+) -> AsyncIterator[TweetRecord]:
+    """Yield bookmarks one by one as their follow-ups finish.
 
-    _follow_truncated(page, tweets)
-    if follow_quotes:
-        _follow_quotes(page, tweets)
-    if follow_threads:
-        _follow_threads(page, tweets)
+    With a ``store``, only bookmarks not stored yet are collected and
+    followed up, scrolling stops at the first run of stored ones, and each
+    new tweet is saved before it is yielded. ``claimed`` lets several
+    accounts share deduplication; see ``iter_bookmarks_sharded``.
+    """
+    async with aclosing(_iter_scrape(
+        page,
+        BOOKMARKS_URL,
+        BOOKMARKS_OPERATION,
+        count=count,
+        max_scrolls=max_scrolls,
+        follow_quotes=follow_quotes,
+        follow_threads=follow_threads,
+        concurrency=concurrency,
+        pacing=pacing,
+        source=source,
+        cache=cache,
+        redirects=redirects,
+        known=store.contains if store is not None else None,
+        claimed=claimed,
+        checkpoint=checkpoint,
+        stats=stats if stats is not None else RunStats(),
+    )) as tweets:
+        async for tweet in tweets:
+            if store is not None:
+                with span("store:save"):
+                    store.save([tweet], bookmarked=True)
+            yield tweet
 
-    return BookmarksResult(tweets=tweets, total_scraped=len(tweets), scrolls_performed=scrolls)
 
-
-def scrape_search(
+async def iter_search(
     page: Page,
     query: str,
     *,
@@ -207,22 +884,416 @@ def scrape_search(
     filter_mode: str = "top",
     follow_quotes: bool = True,
     follow_threads: bool = True,
-) -> SearchResult:
-    """Search Twitter and scrape results."""
+    concurrency: int = DEFAULT_CONCURRENCY,
+    pacing: str = "fixed",
+    source: str = "dom",
+    cache: FollowupCache | None = None,
+    redirects: RedirectResolver | None = None,
+    claimed: Callable[[str], bool] | None = None,
+    pool: PagePool | None = None,
+    checkpoint: Checkpoint | None = None,
+    stats: RunStats | None = None,
+) -> AsyncIterator[TweetRecord]:
+    """Yield search results one by one as their follow-ups finish.
+
+    ``claimed`` and ``pool`` let several searches share deduplication and
+    follow-up tabs; see ``iter_search_batch``.
+    """
     filter_param = "&f=live" if filter_mode == "latest" else ""
     url = f"{SEARCH_URL}?q={query}{filter_param}&src=typed_query"
-    page.goto(url, wait_until="domcontentloaded", timeout=NAV_TIMEOUT)
-    if "login" in page.url.lower():
-        raise RuntimeError("Auth expired. Run: x auth save")
-    page.wait_for_selector('article[data-testid="tweet"]', timeout=SELECTOR_TIMEOUT)
-    time.sleep(INITIAL_LOAD_PAUSE)
+    async with aclosing(_iter_scrape(
+        page,
+        url,
+        SEARCH_OPERATION,
+        count=count,
+        max_scrolls=max_scrolls,
+        follow_quotes=follow_quotes,
+        follow_threads=follow_threads,
+        concurrency=concurrency,
+        pacing=pacing,
+        source=source,
+        cache=cache,
+        redirects=redirects,
+        claimed=claimed,
+        pool=pool,
+        checkpoint=checkpoint,
+        stats=stats if stats is not None else RunStats(),
+    )) as tweets:
+        async for tweet in tweets:
+            yield tweet
+
+
+async def scrape_bookmarks(page: Page, **kwargs) -> BookmarksResult:
+    """Scrape Twitter bookmarks. Takes the same options as ``iter_bookmarks``."""
+    stats = RunStats()
+    tweets = [tweet.to_model() async for tweet in iter_bookmarks(page, stats=stats, **kwargs)]
+    return BookmarksResult(
+        tweets=tweets, total_scraped=len(tweets), scrolls_performed=stats.scrolls, stats=stats
+    )
+
+
+async def scrape_search(page: Page, query: str, **kwargs) -> SearchResult:
+    """Search Twitter and scrape results. Takes the same options as ``iter_search``."""
+    stats = RunStats()
+    tweets = [tweet.to_model() async for tweet in iter_search(page, query, stats=stats, **kwargs)]
+    return SearchResult(
+        query=query,
+        filter=kwargs.get("filter_mode", "top"),
+        tweets=tweets,
+        total_scraped=len(tweets),
+        stats=stats,
+    )
+
+
+class _RecentUrls:
+    """The last ``size`` URLs added, for membership tests; older ones are forgotten."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._order: deque[str] = deque()
+        self._urls: set[str] = set()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def add(self, url: str) -> None:
+        if url in self._urls:
+            return
+        self._order.append(url)
+        self._urls.add(url)
+        if len(self._order) > self._size:
+            self._urls.discard(self._order.popleft())
+
+
+async def _poll_timeline(
+    page: Page,
+    *,
+    interval: float,
+    top: int,
+    seen: _RecentUrls,
+    source: str,
+    capture: ResponseCapture | None,
+    watch: ThrottleWatch,
+    stats: RunStats,
+) -> AsyncIterator[list[TweetRecord]]:
+    """Check the top of an open live timeline every ``interval`` seconds, forever.
+
+    Yields the tweets not in ``seen``, oldest first. The first check only
+    fills ``seen`` with what the page already shows. With a ``capture``,
+    tweets come from the timeline's GraphQL responses, including X's own
+    polls for new posts. Rate limits back off and carry on watching.
+    """
+    extract_js = _dom_js(EXTRACT_TOP_TWEETS_JS, source)
+    first = True
+    throttle_streak = 0
+    while True:
+        if capture is not None:
+            payloads = await capture.take()
+            with span("parse:graphql"):
+                batch = [t for payload in payloads for t in parse_tweets(payload)]
+        else:
+            with span("evaluate:extract_top_tweets"):
+                raw_tweets = await page.evaluate(extract_js, top)
+            batch = [
+                _raw_to_tweet(raw)
+                for raw in raw_tweets
+                if raw.get("tweet_url") and raw["tweet_url"] not in seen
+            ]
+        new_tweets = []
+        for tweet in batch:
+            if tweet.tweet_url in seen:
+                continue
+            seen.add(tweet.tweet_url)
+            new_tweets.append(tweet)
+        if new_tweets and not first:
+            new_tweets.reverse()
+            yield new_tweets
+        first = False
+
+        throttled = watch.take()
+        if throttled or await _rate_limit_notice(page):
+            reason = "HTTP 429" if throttled else "rate limit notice"
+            delay = await back_off(min(throttle_streak, RATE_LIMIT_RETRIES))
+            throttle_streak += 1
+            _throttled(stats, page.url, reason, delay)
+            await pace()  # a paused budget makes us wait out the backoff here
+            with span("evaluate:retry_timeline"):
+                await page.evaluate(RETRY_TIMELINE_JS)
+        else:
+            throttle_streak = 0
+        # Runs forever: keep only recent details, the counts cover the rest
+        del stats.throttles[:-WATCH_STATS_LIMIT]
+        del stats.skipped[:-WATCH_STATS_LIMIT]
 
-    tweets, _ = _scroll_and_collect(page, max_count=count, max_scrolls=max_scrolls)
+        with span("sleep:watch_interval"):
+            await asyncio.sleep(interval)
+        await pace()
+        with span("evaluate:show_new_tweets"):
+            shown = await page.evaluate(SHOW_NEW_TWEETS_JS)
+        if shown:
+            with span("sleep:scroll_settle"):
+                await asyncio.sleep(SCROLL_SETTLE_PAUSE)
 
-    _follow_truncated(page, tweets)
-    if follow_quotes:
-        _follow_quotes(page, tweets)
-    if follow_threads:
-        _follow_threads(page, tweets)
 
-    return SearchResult(query=query, filter=filter_mode, tweets=tweets, total_scraped=len(tweets))
+async def iter_watch(
+    page: Page,
+    query: str,
+    *,
+    interval: float = WATCH_INTERVAL,
+    top: int = WATCH_TOP,
+    seen_limit: int = WATCH_SEEN_LIMIT,
+    follow_quotes: bool = True,
+    follow_threads: bool = True,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    source: str = "dom",
+    cache: FollowupCache | None = None,
+    redirects: RedirectResolver | None = None,
+    stats: RunStats | None = None,
+) -> AsyncIterator[TweetRecord]:
+    """Keep a live search open and yield new tweets, followed up, as they appear.
+
+    Runs until cancelled. Tweets on the page when it opens are only
+    remembered, not yielded. Each check's new tweets are followed up before
+    the next check so they come out without waiting for more; follow-up
+    results are not kept between checks, so memory stays bounded by
+    ``seen_limit``. ``stats`` keeps only the last WATCH_STATS_LIMIT
+    throttles and skips; its counts cover the whole watch.
+    """
+    stats = stats if stats is not None else RunStats()
+    url = f"{SEARCH_URL}?q={query}&f=live&src=typed_query"
+    capture = ResponseCapture(page, [SEARCH_OPERATION]) if source == "network" else None
+    watch = ThrottleWatch(page)
+    pool = PagePool(page.context, concurrency)
+    try:
+        await _with_backoff(url, lambda: _open_timeline(page, url), stats)
+        batches = _poll_timeline(
+            page,
+            interval=interval,
+            top=top,
+            seen=_RecentUrls(seen_limit),
+            source=source,
+            capture=capture,
+            watch=watch,
+            stats=stats,
+        )
+        async with aclosing(batches) as polls:
+            async for batch in polls:
+                await _follow_up(
+                    pool,
+                    batch,
+                    follow_quotes=follow_quotes,
+                    follow_threads=follow_threads,
+                    source=source,
+                    cache=cache,
+                    redirects=redirects,
+                    stats=stats,
+                )
+                for record in batch:
+                    yield record
+    finally:
+        if capture is not None:
+            capture.detach()
+        watch.detach()
+        await pool.close()
+        if cache is not None:
+            stats.cache_hits, stats.cache_misses = cache.hits, cache.misses
+        if redirects is not None:
+            stats.redirects = dict(redirects.counts)
+
+
+def _claims() -> Callable[[str], bool]:
+    """A shared ``claimed`` callback: True for every URL after its first claim."""
+    claimed_urls: set[str] = set()
+
+    def claim(url: str) -> bool:
+        if url in claimed_urls:
+            return True
+        claimed_urls.add(url)
+        return False
+
+    return claim
+
+
+async def _iter_merged(streams: list[tuple[str, AsyncIterator[T]]]) -> AsyncIterator[T]:
+    """Run labelled streams concurrently and yield their items as they arrive.
+
+    A stream that fails is reported on stderr by its label and the rest
+    carry on. At most STREAM_BUFFER items wait to be consumed.
+    """
+    results: asyncio.Queue[T | None] = asyncio.Queue(maxsize=STREAM_BUFFER)
+
+    async def drain(label: str, stream: AsyncIterator[T]) -> None:
+        try:
+            async with aclosing(stream) as items:
+                async for item in items:
+                    await results.put(item)
+        except Exception as exc:
+            print(f"{label} failed: {exc}", file=sys.stderr)
+
+    async def run_all() -> None:
+        await asyncio.gather(*(drain(label, stream) for label, stream in streams))
+        # Not in a finally: once cancelled, nobody is left to make room in a full queue.
+        await results.put(None)
+
+    runner = asyncio.create_task(run_all())
+    try:
+        while (item := await results.get()) is not None:
+            yield item
+        await runner
+    finally:
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+
+
+async def iter_search_batch(
+    contexts: Sequence[BrowserContext],
+    queries: list[str],
+    *,
+    parallel: int = DEFAULT_SEARCH_PARALLEL,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float | None = None,
+    stats: RunStats | None = None,
+    **options,
+) -> AsyncIterator[tuple[str, TweetRecord]]:
+    """Run several searches, yielding (query, tweet) as they finish.
+
+    Each context is one account. Queries are dealt round-robin across
+    accounts; per account, up to ``parallel`` queries scroll at once, each
+    on its own tab, sharing one pool of ``concurrency`` follow-up tabs and
+    one pacing budget of ``rate`` actions per second (unlimited if None; it
+    still carries rate-limit backoffs). A tweet is reported once, for the
+    first query that collects it. A query that fails is reported on stderr
+    and the rest carry on. Other options are passed to ``iter_search``.
+    """
+    stats = stats if stats is not None else RunStats()
+    claim = _claims()
+    pools = [PagePool(context, concurrency) for context in contexts]
+    slots = [asyncio.Semaphore(parallel) for _ in contexts]
+    budgets = [TokenBucket(rate, burst=parallel) for _ in contexts]
+
+    async def search(query: str, shard: int) -> AsyncIterator[tuple[str, TweetRecord]]:
+        set_budget(budgets[shard])
+        async with slots[shard]:
+            page = await contexts[shard].new_page()
+            try:
+                async for tweet in iter_search(
+                    page, query, claimed=claim, pool=pools[shard], stats=stats, **options
+                ):
+                    yield query, tweet
+            finally:
+                await page.close()
+
+    streams = [
+        (f"Search {query!r}", search(query, i % len(contexts))) for i, query in enumerate(queries)
+    ]
+    try:
+        async with aclosing(_iter_merged(streams)) as items:
+            async for item in items:
+                yield item
+    finally:
+        for pool in pools:
+            await pool.close()
+
+
+async def iter_bookmarks_sharded(
+    contexts: Sequence[BrowserContext],
+    *,
+    stats: RunStats | None = None,
+    **options,
+) -> AsyncIterator[TweetRecord]:
+    """Scrape the bookmarks of several accounts at once, one context each.
+
+    Each account scrolls on its own tab with its own follow-up tabs and its
+    own pacing budget, so a rate limit only holds back its account. A tweet
+    bookmarked by several accounts is collected and followed up once, by
+    whichever gets to it first. Options, ``count`` included, apply to each
+    account and are passed to ``iter_bookmarks``.
+    """
+    stats = stats if stats is not None else RunStats()
+    claim = _claims()
+
+    async def bookmarks(context: BrowserContext) -> AsyncIterator[TweetRecord]:
+        set_budget(TokenBucket())
+        page = await context.new_page()
+        try:
+            async for tweet in iter_bookmarks(page, claimed=claim, stats=stats, **options):
+                yield tweet
+        finally:
+            await page.close()
+
+    streams = [(f"Bookmarks of account {i + 1}", bookmarks(context)) for i, context in enumerate(contexts)]
+    async with aclosing(_iter_merged(streams)) as tweets:
+        async for tweet in tweets:
+            yield tweet
+
+
+def time_shards(query: str, since: date, until: date, shard_by: str) -> list[str]:
+    """Split ``query`` into ``since:``/``until:`` sub-queries, one per day or week.
+
+    ``until`` is exclusive, as in X's operator. Windows come newest first;
+    the oldest one is cut short at ``since``.
+    """
+    step = timedelta(days=7 if shard_by == "week" else 1)
+    shards = []
+    end = until
+    while end > since:
+        start = max(since, end - step)
+        shards.append(f"{query} since:{start.isoformat()} until:{end.isoformat()}")
+        end = start
+    return shards
+
+
+async def scrape_bookmarks_sharded(
+    contexts: Sequence[BrowserContext], **kwargs
+) -> BookmarksResult:
+    """Merged bookmarks of several accounts. Takes the options of ``iter_bookmarks_sharded``."""
+    stats = RunStats()
+    tweets = [
+        tweet.to_model() async for tweet in iter_bookmarks_sharded(contexts, stats=stats, **kwargs)
+    ]
+    return BookmarksResult(
+        tweets=tweets, total_scraped=len(tweets), scrolls_performed=stats.scrolls, stats=stats
+    )
+
+
+async def scrape_search_batch(
+    contexts: Sequence[BrowserContext], queries: list[str], **kwargs
+) -> BatchSearchResult:
+    """Run several searches concurrently. Takes the options of ``iter_search_batch``."""
+    stats = RunStats()
+    by_query: dict[str, list[Tweet]] = {query: [] for query in queries}
+    async for query, tweet in iter_search_batch(contexts, queries, stats=stats, **kwargs):
+        by_query[query].append(tweet.to_model())
+    filter_mode = kwargs.get("filter_mode", "top")
+    results = [
+        SearchResult(query=query, filter=filter_mode, tweets=tweets, total_scraped=len(tweets))
+        for query, tweets in by_query.items()
+    ]
+    return BatchSearchResult(
+        filter=filter_mode,
+        results=results,
+        total_scraped=sum(r.total_scraped for r in results),
+        stats=stats,
+    )
+
+
+async def scrape_search_sharded(
+    contexts: Sequence[BrowserContext], query: str, shards: list[str], **kwargs
+) -> SearchResult:
+    """One search run as several shard queries (see ``time_shards``), merged.
+
+    Shards run like a batch, so each tweet is kept once; the merged tweets
+    are sorted newest first, undated ones last. Takes the options of
+    ``iter_search_batch``.
+    """
+    stats = RunStats()
+    records = [tweet async for _, tweet in iter_search_batch(contexts, shards, stats=stats, **kwargs)]
+    records.sort(key=lambda t: t.timestamp or "", reverse=True)
+    tweets = [tweet.to_model() for tweet in records]
+    return SearchResult(
+        query=query,
+        filter=kwargs.get("filter_mode", "top"),
+        tweets=tweets,
+        total_scraped=len(tweets),
+        stats=stats,
+    )
@@ -0,0 +1,111 @@
+"""Local SQLite store of scraped tweets, keyed by status URL."""
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .config import STORE_FILE
+from .models import Tweet, TweetRecord
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tweets (
+    tweet_url   TEXT PRIMARY KEY,
+    user_handle TEXT NOT NULL DEFAULT '',
+    timestamp   TEXT,
+    text        TEXT NOT NULL DEFAULT '',
+    bookmarked  INTEGER NOT NULL DEFAULT 0,
+    stored_at   TEXT NOT NULL,
+    data        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS links (
+    tweet_url    TEXT NOT NULL REFERENCES tweets(tweet_url) ON DELETE CASCADE,
+    kind         TEXT NOT NULL,
+    href         TEXT NOT NULL,
+    resolved_url TEXT,
+    domain       TEXT,
+    category     TEXT,
+    PRIMARY KEY (tweet_url, kind, href)
+);
+CREATE INDEX IF NOT EXISTS links_category ON links(category);
+"""
+
+_LINK_KINDS = ("links", "quoted_links", "thread_links")
+
+
+class TweetStore:
+    """Persistent tweets and their links.
+
+    The full Tweet is kept as JSON in ``tweets.data``; the other columns and
+    the ``links`` table exist for lookups and ad-hoc SQL.
+    """
+
+    def __init__(self, path: Path = STORE_FILE) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "TweetStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def contains(self, tweet_url: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM tweets WHERE tweet_url = ?", (tweet_url,)
+        ).fetchone()
+        return row is not None
+
+    def get(self, tweet_url: str) -> Tweet | None:
+        row = self._conn.execute(
+            "SELECT data FROM tweets WHERE tweet_url = ?", (tweet_url,)
+        ).fetchone()
+        return Tweet.model_validate_json(row[0]) if row else None
+
+    def save(self, tweets: Iterable[Tweet | TweetRecord], *, bookmarked: bool = False) -> None:
+        """Insert or replace tweets and their links in one transaction."""
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._conn:
+            for tweet in tweets:
+                if not tweet.tweet_url:
+                    continue
+                self._conn.execute(
+                    "INSERT INTO tweets (tweet_url, user_handle, timestamp, text, bookmarked, stored_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(tweet_url) DO UPDATE SET "
+                    "user_handle = excluded.user_handle, timestamp = excluded.timestamp, "
+                    "text = excluded.text, bookmarked = max(bookmarked, excluded.bookmarked), "
+                    "data = excluded.data",
+                    (
+                        tweet.tweet_url,
+                        tweet.user_handle,
+                        tweet.timestamp,
+                        tweet.text,
+                        int(bookmarked),
+                        now,
+                        _dump(tweet),
+                    ),
+                )
+                self._conn.execute("DELETE FROM links WHERE tweet_url = ?", (tweet.tweet_url,))
+                for kind in _LINK_KINDS:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO links (tweet_url, kind, href, resolved_url, domain, category) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (tweet.tweet_url, kind, lnk.href, lnk.resolved_url, lnk.domain, lnk.category)
+                            for lnk in getattr(tweet, kind)
+                        ],
+                    )
+
+
+def _dump(tweet: Tweet | TweetRecord) -> str:
+    """The ``tweets.data`` JSON; records are written without building a Tweet."""
+    if isinstance(tweet, TweetRecord):
+        return json.dumps(tweet.to_dict(), ensure_ascii=False, separators=(",", ":"))
+    return tweet.model_dump_json()